@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """A least-recently-used cache whose entries expire after a time-to-live.
+
+    Entries may also be kept for a while after they expire, so that a stale value
+    can be served while a fresh one is being fetched.
+
+    Args:
+        maxsize: The maximum number of entries to keep.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable, stale: bool) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        fresh_until, stale_until, value = entry
+        now = monotonic()
+        if stale_until <= now:
+            del self._entries[key]
+            return None
+        if fresh_until <= now and not stale:
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Look up an entry, returning ``None`` if it is missing or expired."""
+        return self._lookup(key, stale=False)
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Look up an entry, returning it even if it has expired but is not stale."""
+        return self._lookup(key, stale=True)
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0) -> None:
+        """Store an entry, evicting the least recently used.
+
+        Args:
+            key: The entry key.
+            value: The entry value.
+            ttl: The number of seconds the entry is fresh for.
+            stale_ttl: The number of seconds the entry is kept after it expires.
+        """
+        fresh_until = monotonic() + ttl
+        self._entries[key] = (fresh_until, fresh_until + stale_ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
@@ -1,15 +1,129 @@
 import asyncio
+import math
+import os
 import pickle
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from operator import itemgetter
 from types import TracebackType
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import uuid4
 
 import aiohttp
 from yarl import URL
 
 from . import models, urls
+from .cache import TTLCache
 from .decorators import check_tokens, mutually_exclusive
-from .exceptions import ClientAPIError, ClientRequestError, ClientUninitializedError
+from .exceptions import (
+    ClientAPIError,
+    ClientError,
+    ClientRequestError,
+    ClientUninitializedError,
+)
+from .ratelimit import RateLimiter
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    from json import dumps as json_dumps
+    from json import loads as json_loads
+else:
+    json_loads = orjson.loads  # type: ignore
+
+    def _json_default(obj: Any) -> Any:
+        # Unlike the json module, orjson rejects float subclasses outside of numpy
+        if isinstance(obj, float):
+            return float(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    def json_dumps(obj: Any) -> str:  # type: ignore
+        return orjson.dumps(
+            obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+
+def _request_key(
+    url: Union[str, URL], headers: Optional[Dict[str, Any]]
+) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+    """Identify a ``GET`` request, telling apart callers with different headers."""
+    return str(url), tuple(sorted(headers.items())) if headers else ()
+
+
+def _has_contents(path: str) -> bool:
+    """Check whether a file exists and is not empty."""
+    return os.path.isfile(path) and os.path.getsize(path) > 0
+
+
+def _decode(body: bytes) -> Dict[str, Any]:
+    """Parse a JSON response body, skipping the bytes to text decoding step."""
+    return json_loads(body) if body.strip() else {}
+
+
+def _decode_response(method: str, url: Union[str, URL], body: bytes) -> Dict[str, Any]:
+    """Parse a successful response body, which must be JSON."""
+    try:
+        return _decode(body)
+    except ValueError as e:
+        raise ClientRequestError(method, URL(url)) from e
+
+
+def _json_payload(
+    method: str, url: Union[str, URL], json: Dict[str, Any]
+) -> aiohttp.JsonPayload:
+    """Serialize a request body, which must be JSON."""
+    try:
+        return aiohttp.JsonPayload(json, dumps=json_dumps)
+    except TypeError as e:
+        raise ClientRequestError(method, URL(url)) from e
+
+
+def _decode_error(body: bytes) -> Dict[str, Any]:
+    """Parse an error response body, which is not always JSON."""
+    try:
+        return _decode(body)
+    except ValueError:
+        # Error pages from proxies and gateways are HTML or plain text
+        return {"raw": body.decode(errors="replace")}
+
+
+def _round_half_up(value: Union[int, float], places: int) -> float:
+    """Round to a number of decimal places, rounding halves away from zero."""
+    # Parsing the shortest repr makes e.g. 1.005 round to 1.01, as written, not 1.0.
+    # Float subclasses such as numpy.float64 are converted first, as their repr may
+    # not be a plain number.
+    exponent = Decimal(1).scaleb(-places)
+    decimal = Decimal(repr(float(value)))
+    return float(decimal.quantize(exponent, rounding=ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=128)
+def _historicals_url(
+    base: URL,
+    extended_hours: bool,
+    interval: models.HistoricalInterval,
+    span: models.HistoricalSpan,
+) -> URL:
+    """Build the URL of a historicals endpoint, reusing it across calls."""
+    # Every parameter is a plain token, so the query needs no percent-encoding
+    bounds = "extended" if extended_hours else "regular"
+    return URL(
+        f"{base}?bounds={bounds}&interval={interval.value}&span={span.value}",
+        encoded=True,
+    )
 
 
 class RobinhoodClient:
@@ -25,38 +139,146 @@ class RobinhoodClient:
     Args:
         timeout: The request timeout, in seconds.
         session: An open client session to inject, if possible.
-        session_file: A path to a binary file for saving session variables.
+        session_file: A path to a JSON file for saving session variables. If it does
+            not exist yet, a legacy ``.aiorobinhood.pickle`` file in the same directory
+            is migrated to it. A session file holding legacy pickle data is migrated
+            in place.
+        cache_size: The maximum number of cached responses (``0`` disables caching).
+        rate_limit: The maximum number of requests per number of seconds, e.g.
+            ``(5, 1.0)`` (default is unlimited).
+        challenge_provider: An async callable that is given a prompt and returns the
+            MFA or challenge code (default reads it from stdin).
+        pool_size: The maximum number of concurrent connections to Robinhood. Only
+            used when the client creates its own session.
     """
 
+    __slots__ = (
+        "_timeout",
+        "_session",
+        "_pool_size",
+        "_session_file",
+        "_cache",
+        "_etags",
+        "_inflight",
+        "_refreshing",
+        "_instrument_urls",
+        "_limiter",
+        "_challenge_provider",
+        "_access_token",
+        "_auth_headers",
+        "_refresh_token",
+        "_account_url",
+        "_account_num",
+        "_device_token",
+    )
+
     _CLIENT_ID: str = "c82SH0WZOsabOXGP2sxqcj34FxkvfnWRZBKlBjFS"
+    _LEGACY_SESSION_FILE: str = ".aiorobinhood.pickle"
+    _BASE_PREFIX: str = f"{urls.BASE}/"
+    # Order placement is the hottest path, so its url is only stringified once
+    _ORDERS_URL: str = str(urls.ORDERS)
+    _BATCH_SIZE: int = 75
+    _MAX_RETRIES: int = 3
+    _RETRY_BACKOFF: float = 1.0
+    # Time-to-live, in seconds, of cached responses for slow-changing endpoints
+    _CACHE_TTL: Dict[str, float] = {
+        "historicals": 30,
+        "ratings": 300,
+        "tags": 3600,
+    }
+    # Time, in seconds, that expired responses are served while being refreshed
+    _STALE_TTL: Dict[str, float] = {
+        "historicals": 300,
+    }
 
     def __init__(
         self,
         timeout: int,
         session: Optional[aiohttp.ClientSession] = None,
-        session_file: str = ".aiorobinhood.pickle",
+        session_file: str = ".aiorobinhood.json",
+        cache_size: int = 256,
+        rate_limit: Optional[Tuple[int, float]] = None,
+        challenge_provider: Optional[Callable[[str], Awaitable[str]]] = None,
+        pool_size: int = 32,
     ) -> None:
-        self._timeout = timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._session = session
+        self._pool_size = pool_size
+        self._cache = TTLCache(cache_size)
+        self._etags = TTLCache(cache_size)
+        self._limiter = None if rate_limit is None else RateLimiter(*rate_limit)
+        self._challenge_provider = (
+            self._prompt if challenge_provider is None else challenge_provider
+        )
+        self._inflight: Dict[Tuple[str, Any], "asyncio.Future[bytes]"] = {}
+        self._refreshing: Dict[Tuple[str, Any], "asyncio.Future[None]"] = {}
+        self._instrument_urls: Dict[str, str] = {}
         self._session_file = session_file
         self._access_token: Optional[str] = None
+        self._auth_headers: Optional[Dict[str, str]] = None
         self._refresh_token: Optional[str] = None
         self._account_url: Optional[str] = None
         self._account_num: Optional[str] = None
 
-        # Load the device token or generate a new one and save it
-        with open(self._session_file, "ab+") as f:
-            try:
-                f.seek(0)
-                data = pickle.load(f)
-                self._device_token = data["device_token"]
-            except EOFError:
-                self._device_token = str(uuid4())
-                pickle.dump({"device_token": self._device_token}, f)
+        # Load the device token, migrating it from the legacy pickle file written by
+        # older versions, or generate a new one and save it
+        legacy_file = os.path.join(
+            os.path.dirname(self._session_file), self._LEGACY_SESSION_FILE
+        )
+        is_legacy = os.path.abspath(self._session_file) == os.path.abspath(legacy_file)
+        if _has_contents(self._session_file) and not is_legacy:
+            self._device_token = self._read_session_file()["device_token"]
+        elif _has_contents(legacy_file):
+            self._device_token = self._migrate_session_file(legacy_file)["device_token"]
+        else:
+            self._device_token = str(uuid4())
+            self._write_session_file({"device_token": self._device_token})
+
+    def _read_session_file(self) -> Dict[str, Any]:
+        """Read the session variables."""
+        with open(self._session_file, "rb") as f:
+            raw = f.read()
+
+        try:
+            return json_loads(raw)
+        except ValueError as e:
+            if not raw.startswith(pickle.PROTO):
+                msg = f"{self._session_file} is not a JSON session file"
+                raise ValueError(msg) from e
+
+        # A custom session file may still hold pickle data written by older versions
+        return self._migrate_session_file(self._session_file)
+
+    def _migrate_session_file(self, legacy_file: str) -> Dict[str, Any]:
+        """Rewrite the session variables of a legacy pickle file as JSON."""
+        with open(legacy_file, "rb") as f:
+            raw = f.read()
+
+        try:
+            # A legacy file used as the session file is migrated in place
+            data = json_loads(raw)
+        except ValueError:
+            data = pickle.loads(raw)
+        self._write_session_file(data)
+        return data
+
+    def _write_session_file(self, data: Dict[str, Any]) -> None:
+        """Write the session variables."""
+        with open(self._session_file, "w") as f:
+            f.write(json_dumps(data))
 
     async def __aenter__(self) -> "RobinhoodClient":
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            # All traffic goes to a single host, so keep its connections warm
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_size,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout
+            )
         return self
 
     async def __aexit__(
@@ -68,25 +290,39 @@ class RobinhoodClient:
         if self._session is None:
             raise ClientUninitializedError()
 
-        await self._session.close()
-        self._session = None
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client session.
+
+        This is called when exiting the ``async with`` block, and only needs to be
+        called explicitly when the client is used without it.
+        """
+        for task in self._refreshing.values():
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def request(
         self,
         method: str,
-        url: URL,
+        url: Union[str, URL],
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
         success_code: int = 200,
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make a custom request to the Robinhood API servers.
 
         Args:
             method: The HTTP request method.
-            url: The Robinhood API url.
+            url: The Robinhood API url, either parsed or as a string.
             json: JSON request parameters.
             headers: HTTP headers to send with the request.
             success_code: The HTTP status code indicating success.
+            cache_ttl: The number of seconds to cache a successful ``GET`` response
+                for (default is no caching).
 
         Returns:
             The JSON response from the Robinhood API servers.
@@ -96,23 +332,273 @@ class RobinhoodClient:
             ClientRequestError: The HTTP request timed out or failed.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
             ValueError: The url does not originate from the Robinhood API servers.
+
+        Note:
+            Concurrent ``GET`` requests for the same url are coalesced into one, and
+            ``GET`` responses carrying an ``ETag`` are revalidated rather than
+            downloaded again. Callers with different ``headers`` never share a
+            response, and every caller gets its own copy.
         """
-        if url.origin() != urls.BASE:
+        if isinstance(url, str):
+            # A prefix check is enough for strings and avoids parsing the url twice
+            if not url.startswith(self._BASE_PREFIX):
+                raise ValueError(f"{url} does not originate from {urls.BASE}")
+        elif url.origin() != urls.BASE:
             raise ValueError(f"{url} does not originate from {urls.BASE}")
+
+        if method != "GET":
+            response = await self._send(method, url, json, headers, success_code)
+            return _decode_response(method, url, response)
+
+        key = _request_key(url, headers)
+        body: Optional[bytes] = None if cache_ttl is None else self._cache.get(key)
+        if body is None:
+            body = await self._send_coalesced(method, url, json, headers, success_code)
+            if cache_ttl is not None:
+                self._cache.set(key, body, cache_ttl)
+
+        # Every caller decodes its own copy, so callers never share a dict
+        return _decode_response(method, url, body)
+
+    async def _send_coalesced(
+        self,
+        method: str,
+        url: Union[str, URL],
+        json: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, Any]],
+        success_code: int,
+    ) -> bytes:
+        """Send a ``GET`` request, sharing it with concurrent identical requests."""
+        key = _request_key(url, headers)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._send(method, url, json, headers, success_code)
+            )
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._inflight[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        method: str,
+        url: Union[str, URL],
+        json: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, Any]],
+        success_code: int,
+    ) -> bytes:
+        """Send a single request and read its response body."""
         if self._session is None:
             raise ClientUninitializedError()
 
+        # Revalidate previously seen GET responses instead of downloading them again
+        key = _request_key(url, headers)
+        etag_entry = self._etags.get(key) if method == "GET" else None
+        if etag_entry is not None:
+            headers = {**(headers or {}), "If-None-Match": etag_entry[0]}
+
+        data = None if json is None else _json_payload(method, url, json)
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                await self._limiter.acquire()
+
+            try:
+                async with self._session.request(
+                    method, url, headers=headers, data=data, timeout=self._timeout
+                ) as resp:
+                    if resp.status == 304 and etag_entry is not None:
+                        return etag_entry[1]
+
+                    body = await resp.read()
+                    delay = self._retry_delay(resp, attempt)
+                    if delay is None:
+                        if resp.status != success_code:
+                            raise ClientAPIError(
+                                resp.method, resp.url, resp.status, _decode_error(body)
+                            )
+
+                        etag = resp.headers.get("ETag")
+                        if etag is not None and method == "GET":
+                            self._etags.set(key, (etag, body), math.inf)
+                        return body
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                raise ClientRequestError(method, URL(url)) from e
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self, resp: aiohttp.ClientResponse, attempt: int
+    ) -> Optional[float]:
+        """Compute how long to wait before retrying a request, if it is retried."""
+        if resp.status != 429 or attempt >= self._MAX_RETRIES:
+            return None
+
         try:
-            async with self._session.request(
-                method, url, headers=headers, json=json, timeout=self._timeout
-            ) as resp:
-                response = await resp.json()
-                if resp.status != success_code:
-                    raise ClientAPIError(resp.method, resp.url, resp.status, response)
+            delay = float(resp.headers["Retry-After"])
+        except (KeyError, ValueError):
+            # The header is missing or an HTTP date, so back off exponentially
+            delay = self._RETRY_BACKOFF * 2 ** attempt
+
+        # Waiting longer than the request timeout would silently stall the caller, so
+        # the rate limited response is raised instead
+        if delay > (self._timeout.total or math.inf):
+            return None
+        return delay
+
+    def clear_cache(self) -> None:
+        """Discard every cached response."""
+        self._cache.clear()
+        self._etags.clear()
+
+    async def _get_revalidated(
+        self, url: URL, ttl: float, stale_ttl: float
+    ) -> Dict[str, Any]:
+        """Fetch a cached ``GET`` response, refreshing expired ones in the background.
+
+        An expired response is served as-is for up to ``stale_ttl`` seconds while a
+        fresh one is fetched, so only the first call ever waits on the network.
 
+        Args:
+            url: The Robinhood API url.
+            ttl: The number of seconds to cache the response for.
+            stale_ttl: The number of seconds to serve the response after it expires.
+
+        Returns:
+            The JSON response from the Robinhood API servers.
+        """
+        key = _request_key(url, self._auth_headers)
+        body: Optional[bytes] = self._cache.get(key)
+        if body is None:
+            body = self._cache.get_stale(key)
+            if body is None:
+                body = await self._send_coalesced(
+                    "GET", url, None, self._auth_headers, 200
+                )
+                response = _decode_response("GET", url, body)
+                self._cache.set(key, body, ttl, stale_ttl)
                 return response
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            raise ClientRequestError(method, url) from e
+            elif key not in self._refreshing:
+                self._refreshing[key] = asyncio.ensure_future(
+                    self._revalidate(url, ttl, stale_ttl)
+                )
+
+        # Like request, every caller decodes its own copy of the cached response
+        return _decode_response("GET", url, body)
+
+    async def _revalidate(self, url: URL, ttl: float, stale_ttl: float) -> None:
+        """Refresh a cached response in the background."""
+        key = _request_key(url, self._auth_headers)
+        try:
+            body = await self._send_coalesced("GET", url, None, self._auth_headers, 200)
+            # Only cache a response that can be decoded
+            _decode_response("GET", url, body)
+            self._cache.set(key, body, ttl, stale_ttl)
+        except ClientError:
+            # Keep serving the stale response, the next call will try again
+            pass
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def _iter_paginated(
+        self, url: URL, pages: Optional[int] = None, cache_ttl: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the results of a paginated endpoint, one page at a time.
+
+        Robinhood paginates with opaque cursors, so the URL of each page is only known
+        once the previous page has been received.
+
+        Args:
+            url: The URL of the first page.
+            pages: The number of pages to fetch (default is unlimited).
+            cache_ttl: The number of seconds to cache each page for.
+
+        Yields:
+            The results of every fetched page.
+        """
+        if pages == 0:
+            return
+
+        next_url: Optional[str] = str(url)
+        while next_url is not None and (pages is None or pages > 0):
+            response = await self.request(
+                "GET", next_url, headers=self._auth_headers, cache_ttl=cache_ttl
+            )
+            for result in response["results"]:
+                yield result
+
+            next_url = response["next"]
+            if pages is not None:
+                pages -= 1
+
+    async def _paginate(
+        self, url: URL, pages: Optional[int] = None, cache_ttl: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Collect the results of a paginated endpoint.
+
+        Args:
+            url: The URL of the first page.
+            pages: The number of pages to fetch (default is unlimited).
+            cache_ttl: The number of seconds to cache each page for.
+
+        Returns:
+            The concatenated results of every fetched page.
+        """
+        return [result async for result in self._iter_paginated(url, pages, cache_ttl)]
+
+    def _batches(self, values: Iterable[str]) -> List[str]:
+        """Split values into comma-separated batches that Robinhood will accept."""
+        items = list(values)
+        return [
+            ",".join(items[i : i + self._BATCH_SIZE])
+            for i in range(0, len(items), self._BATCH_SIZE)
+        ]
+
+    async def _get_batched(
+        self,
+        url: URL,
+        key: str,
+        values: Iterable[str],
+        cache_ttl: Optional[float] = None,
+        stale_ttl: float = 0,
+    ) -> List[Dict[str, Any]]:
+        """Collect the results of a multi-security endpoint.
+
+        Robinhood caps the number of securities accepted per request, so the values
+        are split into batches which are requested concurrently.
+
+        Args:
+            url: The endpoint URL.
+            key: The query parameter holding the comma-separated values.
+            values: A sequence of stock symbols, instrument URLs, etc.
+            cache_ttl: The number of seconds to cache each batch for.
+            stale_ttl: The number of seconds to serve each batch after it expires.
+
+        Returns:
+            The concatenated results of every batch, in the order of ``values``.
+        """
+        batch_urls = [url.update_query({key: batch}) for batch in self._batches(values)]
+        if cache_ttl is None:
+            requests = [
+                self.request("GET", batch_url, headers=self._auth_headers)
+                for batch_url in batch_urls
+            ]
+        else:
+            requests = [
+                self._get_revalidated(batch_url, cache_ttl, stale_ttl)
+                for batch_url in batch_urls
+            ]
+
+        responses = await asyncio.gather(*requests)
+        return [result for response in responses for result in response["results"]]
+
+    def _set_access_token(self, access_token: Optional[str]) -> None:
+        self._access_token = access_token
+        self._auth_headers = (
+            None if access_token is None else {"Authorization": access_token}
+        )
 
     ###################################################################################
     #                                      OAUTH                                      #
@@ -152,42 +638,69 @@ class RobinhoodClient:
             "username": username,
         }
 
-        try:
-            response = await self.request(
-                "POST", urls.LOGIN, headers=headers, json=json
-            )
-            if response.get("mfa_required"):
-                # Try again with mfa_code if 2fac is enabled
-                mfa_code = input(f"Enter the {response['mfa_type']} code: ")
-                return await self.login(
-                    username, password, expires_in, mfa_code=mfa_code
+        while True:
+            try:
+                response = await self.request(
+                    "POST", urls.LOGIN, headers=headers, json=json
+                )
+            except ClientAPIError as e:
+                if "challenge" not in e.response:
+                    raise e
+
+                # Try again with challenge_id once the challenge is passed
+                challenge_id = await self._respond_to_challenge(
+                    e.response["challenge"], challenge_type
                 )
-        except ClientAPIError as e:
-            response = e.response
-            if "challenge" not in response:
-                raise e
-
-            while True:
-                url = urls.CHALLENGE / response["challenge"]["id"] / "respond/"
-                json = {"response": input(f"Enter the {challenge_type.value} code: ")}
-                try:
-                    response = await self.request("POST", url, json=json)
-                    if "id" in response:
-                        # Try again with challenge_id if challenge is passed
-                        return await self.login(
-                            username, password, expires_in, challenge_id=response["id"]
-                        )
-                except ClientAPIError as e:
-                    if e.response["challenge"]["remaining_attempts"] == 0:
-                        raise e from None
-
-        self._access_token = f"Bearer {response['access_token']}"
+                headers["x-robinhood-challenge-response-id"] = challenge_id
+                continue
+
+            if not response.get("mfa_required"):
+                break
+
+            # Try again with mfa_code if 2fac is enabled
+            json["mfa_code"] = await self._challenge_provider(
+                f"Enter the {response['mfa_type']} code: "
+            )
+
+        self._set_access_token(f"Bearer {response['access_token']}")
         self._refresh_token = response["refresh_token"]
 
-        # Fetch the account info for other methods
-        account = await self.get_account()
-        self._account_url = account["url"]
-        self._account_num = account["account_number"]
+        await self.refresh_account_cache()
+
+    async def _prompt(self, prompt: str) -> str:
+        # Read from stdin in a worker thread so the event loop is not blocked
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, input, prompt)
+
+    async def _respond_to_challenge(
+        self, challenge: Dict[str, Any], challenge_type: models.ChallengeType
+    ) -> str:
+        """Prompt for the SFA challenge code until Robinhood accepts it.
+
+        Args:
+            challenge: The challenge issued by Robinhood.
+            challenge_type: The challenge type.
+
+        Returns:
+            The ID of the passed challenge.
+
+        Raises:
+            ClientAPIError: Robinhood servers responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+        """
+        url = urls.CHALLENGE / challenge["id"] / "respond/"
+        while True:
+            code = await self._challenge_provider(
+                f"Enter the {challenge_type.value} code: "
+            )
+            json = {"response": code}
+            try:
+                response = await self.request("POST", url, json=json)
+                if "id" in response:
+                    return response["id"]
+            except ClientAPIError as e:
+                if e.response["challenge"]["remaining_attempts"] == 0:
+                    raise e from None
 
     @check_tokens
     async def logout(self) -> None:
@@ -201,8 +714,9 @@ class RobinhoodClient:
         """
         json = {"client_id": self._CLIENT_ID, "token": self._refresh_token}
         await self.request("POST", urls.LOGOUT, json=json)
-        self._access_token = None
+        self._set_access_token(None)
         self._refresh_token = None
+        self.clear_cache()
 
     @check_tokens
     async def refresh(self, expires_in: int = 86400) -> None:
@@ -225,26 +739,30 @@ class RobinhoodClient:
             "scope": "internal",
         }
         response = await self.request("POST", urls.LOGIN, json=json)
-        self._access_token = f"Bearer {response['access_token']}"
+        self._set_access_token(f"Bearer {response['access_token']}")
         self._refresh_token = response["refresh_token"]
 
     @check_tokens
     async def dump(self) -> None:
-        """Write the session tokens to the session file.
+        """Write the session tokens and account info to the session file.
 
         Raises:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
         """
-        with open(self._session_file, "rb+") as f:
-            data = pickle.load(f)
-            data["access_token"] = self._access_token
-            data["refresh_token"] = self._refresh_token
-            f.seek(0)
-            pickle.dump(data, f)
-            f.truncate()
+        # Do the file I/O in a worker thread so the event loop is not blocked
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, self._read_session_file)
+        data["access_token"] = self._access_token
+        data["refresh_token"] = self._refresh_token
+        data["account_url"] = self._account_url
+        data["account_num"] = self._account_num
+        await loop.run_in_executor(None, self._write_session_file, data)
 
     async def load(self) -> None:
-        """Read the session tokens from the session file.
+        """Read the session tokens and account info from the session file.
+
+        The account info is only fetched from Robinhood if it is missing from the
+        session file.
 
         Raises:
             ClientAPIError: Robinhood server responded with an error.
@@ -252,12 +770,32 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        with open(self._session_file, "rb") as f:
-            data = pickle.load(f)
-            self._access_token = data.get("access_token")
-            self._refresh_token = data.get("refresh_token")
+        # Do the file I/O in a worker thread so the event loop is not blocked
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, self._read_session_file)
+        self._set_access_token(data.get("access_token"))
+        self._refresh_token = data.get("refresh_token")
+        self._account_url = data.get("account_url")
+        self._account_num = data.get("account_num")
 
-        # Fetch the account URL during login for order methods
+        if self._account_url is not None and self._account_num is not None:
+            return
+
+        await self.refresh_account_cache()
+
+    @check_tokens
+    async def refresh_account_cache(self) -> None:
+        """Fetch the account info used by the profile and order methods.
+
+        The account info is fetched on :meth:`~.login` and saved by :meth:`~.dump`,
+        so this only needs to be called after the Robinhood account changes.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+        """
         account = await self.get_account()
         self._account_url = account["url"]
         self._account_num = account["account_number"]
@@ -279,8 +817,7 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        headers = {"Authorization": self._access_token}
-        response = await self.request("GET", urls.ACCOUNTS, headers=headers)
+        response = await self.request("GET", urls.ACCOUNTS, headers=self._auth_headers)
         return response["results"][0]
 
     @check_tokens
@@ -297,10 +834,31 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        headers = {"Authorization": self._access_token}
-        response = await self.request("GET", urls.PORTFOLIOS, headers=headers)
+        response = await self.request(
+            "GET", urls.PORTFOLIOS, headers=self._auth_headers
+        )
         return response["results"][0]
 
+    @check_tokens
+    async def get_profile_bundle(self) -> Dict[str, Any]:
+        """Fetch the account, portfolio, and open positions concurrently.
+
+        Returns:
+            A mapping with the ``account``, ``portfolio``, and ``positions`` keys, as
+            returned by :meth:`~.get_account`, :meth:`~.get_portfolio`, and
+            :meth:`~.get_positions`, respectively.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+        """
+        account, portfolio, positions = await asyncio.gather(
+            self.get_account(), self.get_portfolio(), self.get_positions()
+        )
+        return {"account": account, "portfolio": portfolio, "positions": positions}
+
     @check_tokens
     async def get_historical_portfolio(
         self,
@@ -329,15 +887,13 @@ class RobinhoodClient:
             Certain combinations of ``interval`` and ``span`` will be rejected by
             Robinhood.
         """
-        url = (urls.PORTFOLIOS / "historicals" / f"{self._account_num}/").with_query(
-            {
-                "bounds": "extended" if extended_hours else "regular",
-                "interval": interval.value,
-                "span": span.value,
-            }
+        url = _historicals_url(
+            urls.PORTFOLIO_HISTORICALS / f"{self._account_num}/",
+            extended_hours,
+            interval,
+            span,
         )
-        headers = {"Authorization": self._access_token}
-        return await self.request("GET", url, headers=headers)
+        return await self.request("GET", url, headers=self._auth_headers)
 
     ###################################################################################
     #                                     ACCOUNT                                     #
@@ -363,16 +919,32 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        results = []
-        url = urls.POSITIONS.with_query({"nonzero": str(nonzero).lower()})
-        headers = {"Authorization": self._access_token}
-        while url is not None and (pages is None or pages > 0):
-            response = await self.request("GET", URL(url), headers=headers)
-            results += response["results"]
-            url = response["next"]
-            pages = pages and pages - 1
+        url = urls.POSITIONS.with_query({"nonzero": "true" if nonzero else "false"})
+        return await self._paginate(url, pages)
+
+    @check_tokens
+    async def iter_positions(
+        self, nonzero: bool = True, pages: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the positions held by the account as each page arrives.
 
-        return results
+        Args:
+            nonzero: Only fetch open positions.
+            pages: The number of pages to fetch (default is unlimited).
+
+        Yields:
+            Position data for each holding, including quantity of shares held and
+            average buy price.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+        """
+        url = urls.POSITIONS.with_query({"nonzero": "true" if nonzero else "false"})
+        async for position in self._iter_paginated(url, pages):
+            yield position
 
     @check_tokens
     async def get_watchlist(
@@ -393,16 +965,10 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        results = []
         url = urls.WATCHLISTS / f"{watchlist}/"
-        headers = {"Authorization": self._access_token}
-        while url is not None and (pages is None or pages > 0):
-            response = await self.request("GET", URL(url), headers=headers)
-            results += response["results"]
-            url = response["next"]
-            pages = pages and pages - 1
-
-        return [result["instrument"] for result in results]
+        return [
+            result["instrument"] async for result in self._iter_paginated(url, pages)
+        ]
 
     @check_tokens
     async def add_to_watchlist(
@@ -421,9 +987,10 @@ class RobinhoodClient:
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
         url = urls.WATCHLISTS / f"{watchlist}/"
-        headers = {"Authorization": self._access_token}
         json = {"instrument": instrument}
-        await self.request("POST", url, headers=headers, json=json, success_code=201)
+        await self.request(
+            "POST", url, headers=self._auth_headers, json=json, success_code=201
+        )
 
     @check_tokens
     async def remove_from_watchlist(self, id_: str, watchlist: str = "Default") -> None:
@@ -440,8 +1007,7 @@ class RobinhoodClient:
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
         url = urls.WATCHLISTS / watchlist / f"{id_}/"
-        headers = {"Authorization": self._access_token}
-        await self.request("DELETE", url, headers=headers, success_code=204)
+        await self.request("DELETE", url, headers=self._auth_headers, success_code=204)
 
     ###################################################################################
     #                                     STOCKS                                      #
@@ -472,13 +1038,11 @@ class RobinhoodClient:
             ValueError: Both/neither of ``symbols`` and ``instruments`` are supplied.
         """
         if symbols is not None:
-            url = urls.FUNDAMENTALS.with_query({"symbols": ",".join(symbols)})
+            key, values = "symbols", symbols
         elif instruments is not None:
-            url = urls.FUNDAMENTALS.with_query({"instruments": ",".join(instruments)})
+            key, values = "instruments", instruments
 
-        headers = {"Authorization": self._access_token}
-        response = await self.request("GET", url, headers=headers)
-        return response["results"]
+        return await self._get_batched(urls.FUNDAMENTALS, key, values)
 
     @mutually_exclusive("symbol", "ids")
     @check_tokens
@@ -506,20 +1070,114 @@ class RobinhoodClient:
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
             ValueError: Both/neither of ``symbol`` and ``ids`` are supplied.
         """
-        results = []
         if symbol is not None:
             url = urls.INSTRUMENTS.with_query({"symbol": symbol})
         elif ids is not None:
             url = urls.INSTRUMENTS.with_query({"ids": ",".join(ids)})
 
-        headers = {"Authorization": self._access_token}
-        while url is not None and (pages is None or pages > 0):
-            response = await self.request("GET", URL(url), headers=headers)
-            results += response["results"]
-            url = response["next"]
-            pages = pages and pages - 1
+        return await self._paginate(url, pages)
+
+    @mutually_exclusive("symbol", "ids")
+    @check_tokens
+    async def iter_instruments(
+        self,
+        symbol: Optional[str] = None,
+        ids: Optional[Iterable[str]] = None,
+        pages: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the instrument information of securities as each page arrives.
+
+        Args:
+            symbol: A single stock symbol.
+            ids: A sequence of instrument IDs.
+            pages: The number of pages to fetch (default is unlimited).
+
+        Yields:
+            Instrument data for each security, including ID and various URLs for
+            fetching particular information.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+            ValueError: Both/neither of ``symbol`` and ``ids`` are supplied.
+        """
+        if symbol is not None:
+            url = urls.INSTRUMENTS.with_query({"symbol": symbol})
+        elif ids is not None:
+            url = urls.INSTRUMENTS.with_query({"ids": ",".join(ids)})
+
+        async for instrument in self._iter_paginated(url, pages):
+            yield instrument
+
+    async def _instrument_url(self, symbol: str) -> str:
+        """Look up the instrument URL of a stock symbol, which never changes."""
+        url = self._instrument_urls.get(symbol.upper())
+        if url is None:
+            instruments = await self.get_instruments(symbol=symbol)
+            url = self._instrument_urls[symbol.upper()] = instruments[0]["url"]
+        return url
+
+    async def _quote(self, symbol: str) -> Dict[str, Any]:
+        """Fetch the quote of a stock symbol, caching the instrument URL it carries."""
+        quote = (await self.get_quotes(symbols=[symbol]))[0]
+        self._instrument_urls[symbol.upper()] = quote["instrument"]
+        return quote
+
+    def invalidate_instrument(self, symbol: str) -> None:
+        """Forget the cached instrument URL of a stock symbol.
+
+        Instrument URLs are looked up once per symbol when placing orders, or taken
+        from the quote fetched for a market order, and kept for the lifetime of the
+        client.
 
-        return results
+        Args:
+            symbol: A stock symbol.
+        """
+        self._instrument_urls.pop(symbol.upper(), None)
+
+    @check_tokens
+    async def get_instrument_urls(self, symbols: Iterable[str]) -> Dict[str, str]:
+        """Fetch the instrument URLs of several stock symbols at once.
+
+        The URLs are read from a single batched quote request rather than one
+        instrument request per symbol, and are cached for use when placing orders.
+
+        Args:
+            symbols: A sequence of stock symbols.
+
+        Returns:
+            A mapping from each recognized stock symbol, as spelled in ``symbols``, to
+            its instrument URL.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+        """
+        # Robinhood symbols are upper case, so the cache is too, whatever the case
+        # the caller spelled them in
+        symbols = list(dict.fromkeys(symbols))
+        missing = list(
+            dict.fromkeys(
+                symbol.upper()
+                for symbol in symbols
+                if symbol.upper() not in self._instrument_urls
+            )
+        )
+        if missing:
+            # Robinhood returns null quotes for symbols it does not recognize
+            for quote in await self.get_quotes(symbols=missing):
+                if quote is not None:
+                    self._instrument_urls[quote["symbol"].upper()] = quote["instrument"]
+
+        return {
+            symbol: self._instrument_urls[symbol.upper()]
+            for symbol in symbols
+            if symbol.upper() in self._instrument_urls
+        }
 
     @mutually_exclusive("symbols", "instruments")
     @check_tokens
@@ -546,13 +1204,11 @@ class RobinhoodClient:
             ValueError: Both/neither of ``symbols`` and ``instruments`` are supplied.
         """
         if symbols is not None:
-            url = urls.QUOTES.with_query({"symbols": ",".join(symbols)})
+            key, values = "symbols", symbols
         elif instruments is not None:
-            url = urls.QUOTES.with_query({"instruments": ",".join(instruments)})
+            key, values = "instruments", instruments
 
-        headers = {"Authorization": self._access_token}
-        response = await self.request("GET", url, headers=headers)
-        return response["results"]
+        return await self._get_batched(urls.QUOTES, key, values)
 
     @mutually_exclusive("symbols", "instruments")
     @check_tokens
@@ -588,21 +1244,19 @@ class RobinhoodClient:
             Certain combinations of ``interval`` and ``span`` will be rejected by
             Robinhood.
         """
-        url = urls.HISTORICALS.with_query(
-            {
-                "bounds": "extended" if extended_hours else "regular",
-                "interval": interval.value,
-                "span": span.value,
-            }
-        )
         if symbols is not None:
-            url = url.update_query({"symbols": ",".join(symbols)})
+            key, values = "symbols", symbols
         elif instruments is not None:
-            url = url.update_query({"instruments": ",".join(instruments)})
-
-        headers = {"Authorization": self._access_token}
-        response = await self.request("GET", url, headers=headers)
-        return response["results"]
+            key, values = "instruments", instruments
+
+        url = _historicals_url(urls.HISTORICALS, extended_hours, interval, span)
+        return await self._get_batched(
+            url,
+            key,
+            values,
+            cache_ttl=self._CACHE_TTL["historicals"],
+            stale_ttl=self._STALE_TTL["historicals"],
+        )
 
     @check_tokens
     async def get_ratings(
@@ -612,7 +1266,7 @@ class RobinhoodClient:
 
         Args:
             ids: A sequence of instrument IDs.
-            pages: The number of pages to fetch (default is unlimited).
+            pages: The number of pages to fetch per batch (default is unlimited).
 
         Returns:
             A list of analyst ratings for the provided securities.
@@ -623,16 +1277,43 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        results = []
-        url = urls.RATINGS.with_query({"ids": ",".join(ids)})
-        headers = {"Authorization": self._access_token}
-        while url is not None and (pages is None or pages > 0):
-            response = await self.request("GET", URL(url), headers=headers)
-            results += response["results"]
-            url = response["next"]
-            pages = pages and pages - 1
+        batches = await asyncio.gather(
+            *[
+                self._paginate(
+                    urls.RATINGS.with_query({"ids": batch}),
+                    pages,
+                    cache_ttl=self._CACHE_TTL["ratings"],
+                )
+                for batch in self._batches(ids)
+            ]
+        )
+        return [rating for batch in batches for rating in batch]
 
-        return results
+    @check_tokens
+    async def iter_ratings(
+        self, ids: Iterable[str], pages: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the buy/sell/hold ratings for securities as each page arrives.
+
+        Args:
+            ids: A sequence of instrument IDs.
+            pages: The number of pages to fetch per batch (default is unlimited).
+
+        Yields:
+            Analyst ratings for the provided securities.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+        """
+        for batch in self._batches(ids):
+            url = urls.RATINGS.with_query({"ids": batch})
+            async for rating in self._iter_paginated(
+                url, pages, cache_ttl=self._CACHE_TTL["ratings"]
+            ):
+                yield rating
 
     @check_tokens
     async def get_tags(self, id_: str) -> List[str]:
@@ -650,10 +1331,11 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        url = urls.TAGS / "instrument" / f"{id_}/"
-        headers = {"Authorization": self._access_token}
-        response = await self.request("GET", url, headers=headers)
-        return [tag["slug"] for tag in response["tags"]]
+        url = urls.INSTRUMENT_TAGS / f"{id_}/"
+        response = await self.request(
+            "GET", url, headers=self._auth_headers, cache_ttl=self._CACHE_TTL["tags"]
+        )
+        return list(map(itemgetter("slug"), response["tags"]))
 
     @check_tokens
     async def get_tag_members(self, tag: str) -> List[str]:
@@ -671,10 +1353,11 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        url = urls.TAGS / "tag" / f"{tag}/"
-        headers = {"Authorization": self._access_token}
-        response = await self.request("GET", url, headers=headers)
-        return response["instruments"]
+        url = urls.TAG_MEMBERS / f"{tag}/"
+        response = await self.request(
+            "GET", url, headers=self._auth_headers, cache_ttl=self._CACHE_TTL["tags"]
+        )
+        return list(response["instruments"])
 
     ###################################################################################
     #                                     ORDERS                                      #
@@ -701,18 +1384,35 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        results = []
-        # fmt: off
-        url: Optional[URL] = urls.ORDERS if order_id is None else urls.ORDERS / f"{order_id}/"  # noqa: E501
-        # fmt: on
-        headers = {"Authorization": self._access_token}
-        while url is not None and (pages is None or pages > 0):
-            response = await self.request("GET", URL(url), headers=headers)
-            results += response.get("results", [response])
-            url = response.get("next")
-            pages = pages and pages - 1
-
-        return results
+        if order_id is not None:
+            url = urls.ORDERS / f"{order_id}/"
+            return [await self.request("GET", url, headers=self._auth_headers)]
+
+        return await self._paginate(urls.ORDERS, pages)
+
+    @check_tokens
+    async def iter_orders(
+        self, pages: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over historical order information as each page arrives.
+
+        Unlike :meth:`~.get_orders`, orders are yielded without waiting for every
+        page to be fetched, and the iteration can be stopped early.
+
+        Args:
+            pages: The number of pages to fetch (default is unlimited).
+
+        Yields:
+            Order information for every order placed on the Robinhood account.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+        """
+        async for order in self._iter_paginated(urls.ORDERS, pages):
+            yield order
 
     @check_tokens
     async def cancel_order(self, order_id: str) -> None:
@@ -728,8 +1428,7 @@ class RobinhoodClient:
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
         url = urls.ORDERS / order_id / "cancel/"
-        headers = {"Authorization": self._access_token}
-        await self.request("POST", url, headers=headers)
+        await self.request("POST", url, headers=self._auth_headers)
 
     @check_tokens
     async def place_order(self, **kwargs) -> str:
@@ -744,13 +1443,92 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        headers = {"Authorization": self._access_token}
-        json = {"account": self._account_url, "ref_id": str(uuid4()), **kwargs}
+        json = {"account": self._account_url, "ref_id": uuid4().hex, **kwargs}
         response = await self.request(
-            "POST", urls.ORDERS, headers=headers, json=json, success_code=201
+            "POST",
+            self._ORDERS_URL,
+            headers=self._auth_headers,
+            json=json,
+            success_code=201,
         )
         return response["id"]
 
+    @check_tokens
+    async def place_orders_bulk(
+        self, orders: Iterable[Dict[str, Any]]
+    ) -> List[Union[str, ClientError]]:
+        """Place several custom orders concurrently.
+
+        Each order is given as the keyword arguments of :meth:`~.place_order`,
+        except for ``instrument``, which is looked up from the ``symbol`` with
+        :meth:`~.get_instrument_urls`.
+
+        Args:
+            orders: The orders to place.
+
+        Returns:
+            The order IDs, in the same order as ``orders``. An order that failed is
+            given by its :class:`~.ClientError` instead, so that the IDs of the orders
+            that were placed are never lost.
+
+        Raises:
+            ClientAPIError: Robinhood server responded with an error.
+            ClientRequestError: The HTTP request timed out or failed.
+            ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
+            ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
+            ValueError: An order specifies its ``instrument``, or Robinhood does not
+                recognize some of the symbols, in which case no order is placed.
+        """
+        orders = list(orders)
+        if any("instrument" in order for order in orders):
+            raise ValueError("Orders must not specify an instrument")
+
+        instrument_urls = await self.get_instrument_urls(o["symbol"] for o in orders)
+        unknown = sorted({o["symbol"] for o in orders} - instrument_urls.keys())
+        if unknown:
+            raise ValueError(f"Unknown symbols: {', '.join(unknown)}")
+
+        return await asyncio.gather(
+            *[
+                self._place_order_or_error(
+                    instrument=instrument_urls[order["symbol"]], **order
+                )
+                for order in orders
+            ]
+        )
+
+    async def _place_order_or_error(self, **kwargs: Any) -> Union[str, ClientError]:
+        """Place a custom order, returning the error instead of raising it."""
+        try:
+            return await self.place_order(**kwargs)
+        except ClientError as e:
+            return e
+
+    async def _place_triggered_order(
+        self,
+        symbol: str,
+        quantity: int,
+        time_in_force: models.OrderTimeInForce,
+        extended_hours: bool,
+        *,
+        side: str,
+        trigger: str,
+        type_: str,
+        **prices: Union[int, float],
+    ) -> str:
+        """Place a limit or stop order, the shared body of the order helpers below."""
+        return await self.place_order(
+            extended_hours=extended_hours,
+            instrument=await self._instrument_url(symbol),
+            quantity=quantity,
+            side=side,
+            symbol=symbol,
+            time_in_force=time_in_force.value,
+            trigger=trigger,
+            type=type_,
+            **prices,
+        )
+
     @check_tokens
     async def place_limit_buy_order(
         self,
@@ -779,17 +1557,15 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        instruments = await self.get_instruments(symbol=symbol)
-        return await self.place_order(
-            extended_hours=extended_hours,
-            instrument=instruments[0]["url"],
-            price=price,
-            quantity=quantity,
+        return await self._place_triggered_order(
+            symbol,
+            quantity,
+            time_in_force,
+            extended_hours,
             side="buy",
-            symbol=symbol,
-            time_in_force=time_in_force.value,
             trigger="immediate",
-            type="limit",
+            type_="limit",
+            price=price,
         )
 
     @check_tokens
@@ -820,19 +1596,53 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        instruments = await self.get_instruments(symbol=symbol)
-        return await self.place_order(
-            extended_hours=extended_hours,
-            instrument=instruments[0]["url"],
-            price=price,
-            quantity=quantity,
+        return await self._place_triggered_order(
+            symbol,
+            quantity,
+            time_in_force,
+            extended_hours,
             side="sell",
-            symbol=symbol,
-            time_in_force=time_in_force.value,
             trigger="immediate",
-            type="limit",
+            type_="limit",
+            price=price,
         )
 
+    async def _place_market_order(
+        self,
+        symbol: str,
+        amount: Optional[Union[int, float]],
+        quantity: Optional[Union[int, float]],
+        time_in_force: models.OrderTimeInForce,
+        extended_hours: bool,
+        *,
+        side: str,
+        price_field: str,
+    ) -> str:
+        """Place a market order, the shared body of the order helpers below."""
+        quote = await self._quote(symbol)
+        price = float(quote[price_field])
+
+        payload = {
+            "extended_hours": extended_hours,
+            "instrument": quote["instrument"],
+            "price": price,
+            "side": side,
+            "symbol": symbol,
+            "time_in_force": time_in_force.value,
+            "trigger": "immediate",
+            "type": "market",
+        }
+        if amount is not None:
+            payload["dollar_based_amount"] = {
+                "amount": _round_half_up(amount, 2),
+                "currency_code": "USD",
+            }
+            payload["quantity"] = _round_half_up(amount / price, 6)
+        elif quantity is not None:
+            payload["quantity"] = _round_half_up(quantity, 6)
+
+        return await self.place_order(**payload)
+
     @mutually_exclusive("amount", "quantity")
     @check_tokens
     async def place_market_buy_order(
@@ -863,29 +1673,15 @@ class RobinhoodClient:
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
             ValueError: Both/neither of ``amount`` and ``quantity`` are supplied.
         """
-        quotes = await self.get_quotes(symbols=[symbol])
-        ask_price = float(quotes[0]["ask_price"])
-
-        payload = {
-            "extended_hours": extended_hours,
-            "instrument": quotes[0]["instrument"],
-            "price": ask_price,
-            "side": "buy",
-            "symbol": symbol,
-            "time_in_force": time_in_force.value,
-            "trigger": "immediate",
-            "type": "market",
-        }
-        if amount is not None:
-            payload["dollar_based_amount"] = {
-                "amount": round(amount, 2),
-                "currency_code": "USD",
-            }
-            payload["quantity"] = round(amount / ask_price, 6)
-        elif quantity is not None:
-            payload["quantity"] = round(quantity, 6)
-
-        return await self.place_order(**payload)
+        return await self._place_market_order(
+            symbol,
+            amount,
+            quantity,
+            time_in_force,
+            extended_hours,
+            side="buy",
+            price_field="ask_price",
+        )
 
     @mutually_exclusive("amount", "quantity")
     @check_tokens
@@ -917,29 +1713,15 @@ class RobinhoodClient:
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
             ValueError: Both/neither of ``amount`` and ``quantity`` are supplied.
         """
-        quotes = await self.get_quotes(symbols=[symbol])
-        bid_price = float(quotes[0]["bid_price"])
-
-        payload = {
-            "extended_hours": extended_hours,
-            "instrument": quotes[0]["instrument"],
-            "price": bid_price,
-            "side": "sell",
-            "symbol": symbol,
-            "time_in_force": time_in_force.value,
-            "trigger": "immediate",
-            "type": "market",
-        }
-        if amount is not None:
-            payload["quantity"] = round(amount / bid_price, 6)
-            payload["dollar_based_amount"] = {
-                "amount": round(amount, 2),
-                "currency_code": "USD",
-            }
-        elif quantity is not None:
-            payload["quantity"] = round(quantity, 6)
-
-        return await self.place_order(**payload)
+        return await self._place_market_order(
+            symbol,
+            amount,
+            quantity,
+            time_in_force,
+            extended_hours,
+            side="sell",
+            price_field="bid_price",
+        )
 
     @check_tokens
     async def place_stop_buy_order(
@@ -969,18 +1751,16 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        instruments = await self.get_instruments(symbol=symbol)
-        return await self.place_order(
-            extended_hours=extended_hours,
-            instrument=instruments[0]["url"],
-            price=price,
-            quantity=quantity,
+        return await self._place_triggered_order(
+            symbol,
+            quantity,
+            time_in_force,
+            extended_hours,
             side="buy",
-            stop_price=price,
-            symbol=symbol,
-            time_in_force=time_in_force.value,
             trigger="stop",
-            type="market",
+            type_="market",
+            price=price,
+            stop_price=price,
         )
 
     @check_tokens
@@ -1011,17 +1791,15 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        instruments = await self.get_instruments(symbol=symbol)
-        return await self.place_order(
-            extended_hours=extended_hours,
-            instrument=instruments[0]["url"],
-            quantity=quantity,
+        return await self._place_triggered_order(
+            symbol,
+            quantity,
+            time_in_force,
+            extended_hours,
             side="sell",
-            stop_price=price,
-            symbol=symbol,
-            time_in_force=time_in_force.value,
             trigger="stop",
-            type="market",
+            type_="market",
+            stop_price=price,
         )
 
     @check_tokens
@@ -1054,18 +1832,16 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        instruments = await self.get_instruments(symbol=symbol)
-        return await self.place_order(
-            extended_hours=extended_hours,
-            instrument=instruments[0]["url"],
-            price=price,
-            quantity=quantity,
+        return await self._place_triggered_order(
+            symbol,
+            quantity,
+            time_in_force,
+            extended_hours,
             side="buy",
-            stop_price=stop_price,
-            symbol=symbol,
-            time_in_force=time_in_force.value,
             trigger="stop",
-            type="limit",
+            type_="limit",
+            price=price,
+            stop_price=stop_price,
         )
 
     @check_tokens
@@ -1098,16 +1874,14 @@ class RobinhoodClient:
             ClientUnauthenticatedError: The :class:`~.RobinhoodClient` is not logged in.
             ClientUninitializedError: The :class:`~.RobinhoodClient` is not initialized.
         """
-        instruments = await self.get_instruments(symbol=symbol)
-        return await self.place_order(
-            extended_hours=extended_hours,
-            instrument=instruments[0]["url"],
-            price=price,
-            quantity=quantity,
+        return await self._place_triggered_order(
+            symbol,
+            quantity,
+            time_in_force,
+            extended_hours,
             side="sell",
-            stop_price=stop_price,
-            symbol=symbol,
-            time_in_force=time_in_force.value,
             trigger="stop",
-            type="limit",
+            type_="limit",
+            price=price,
+            stop_price=stop_price,
         )
@@ -1,29 +1,52 @@
 from functools import wraps
+from inspect import isasyncgenfunction
 from typing import Callable
 
 from .exceptions import ClientUnauthenticatedError
 
 
-def check_tokens(func: Callable):
+def _guard(func: Callable, check: Callable[..., None]):
+    """Run a check on the arguments before a coroutine or async generator."""
+    if isasyncgenfunction(func):
+
+        @wraps(func)
+        async def gen_inner(*args, **kwargs):
+            check(*args, **kwargs)
+            agen = func(*args, **kwargs)
+            try:
+                async for item in agen:
+                    yield item
+            finally:
+                # Run the cleanup of the inner generator as soon as the caller stops
+                await agen.aclose()
+
+        return gen_inner
+
     @wraps(func)
-    async def inner(self, *args, **kwargs):
+    async def inner(*args, **kwargs):
+        check(*args, **kwargs)
+        return await func(*args, **kwargs)
+
+    return inner
+
+
+def check_tokens(func: Callable):
+    def check(self, *args, **kwargs):
         if self._access_token is None or self._refresh_token is None:
             raise ClientUnauthenticatedError()
-        return await func(self, *args, **kwargs)
 
-    return inner
+    return _guard(func, check)
 
 
 def mutually_exclusive(keyword: str, *keywords: str):
     keywords = (keyword, *keywords)
+    keyword_set = frozenset(keywords)
 
-    def wrapper(func: Callable):
-        @wraps(func)
-        async def inner(*args, **kwargs):
-            if sum(k in keywords for k in kwargs) != 1:
-                raise ValueError(f"You must specify exactly one of {keywords}")
-            return await func(*args, **kwargs)
+    def check(*args, **kwargs):
+        if len(keyword_set.intersection(kwargs)) != 1:
+            raise ValueError(f"You must specify exactly one of {keywords}")
 
-        return inner
+    def wrapper(func: Callable):
+        return _guard(func, check)
 
     return wrapper
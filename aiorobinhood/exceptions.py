@@ -50,6 +50,9 @@ class ClientRequestError(ClientError):
         self.method = method
         self.url = url
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(method={self.method!r}, url={str(self.url)!r})"
+
 
 class ClientAPIError(ClientRequestError):
     """Indicates there was an invalid response from the Robinhood servers.
@@ -71,3 +74,9 @@ class ClientAPIError(ClientRequestError):
         super().__init__(method, url, msg)
         self.status = status
         self.response = response
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(method={self.method!r}, url={str(self.url)!r}, "
+            f"status={self.status!r})"
+        )
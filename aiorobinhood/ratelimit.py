@@ -0,0 +1,40 @@
+from asyncio import sleep
+from time import monotonic
+
+
+class RateLimiter:
+    """A token bucket that allows bursts of up to ``rate`` requests per ``period``.
+
+    Args:
+        rate: The maximum number of requests per period.
+        period: The length of the period, in seconds.
+
+    Raises:
+        ValueError: The rate or period is not positive.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        if rate <= 0 or period <= 0:
+            raise ValueError("The rate and period must be positive")
+
+        self._rate = rate
+        self._period = period
+        self._tokens = float(rate)
+        self._updated = monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            now = monotonic()
+            self._tokens = min(
+                self._rate,
+                self._tokens + (now - self._updated) * self._rate / self._period,
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            # Sleep until the next token is due, then check again in case another
+            # request took it first
+            await sleep((1 - self._tokens) * self._period / self._rate)
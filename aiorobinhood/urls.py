@@ -12,6 +12,7 @@ CHALLENGE = BASE / "challenge/"
 # Profile
 ACCOUNTS = BASE / "accounts/"
 PORTFOLIOS = BASE / "portfolios/"
+PORTFOLIO_HISTORICALS = PORTFOLIOS / "historicals/"
 
 # Account
 POSITIONS = BASE / "positions/"
@@ -25,6 +26,8 @@ HISTORICALS = QUOTES / "historicals/"
 MIDLANDS = BASE / "midlands/"
 RATINGS = MIDLANDS / "ratings/"
 TAGS = MIDLANDS / "tags/"
+INSTRUMENT_TAGS = TAGS / "instrument/"
+TAG_MEMBERS = TAGS / "tag/"
 
 # Orders
 ORDERS = BASE / "orders/"
@@ -55,6 +55,7 @@ setup(
             "pytest-cov",
         ],
         "docs": ["aiohttp_theme", "sphinx", "sphinx-autodoc-typehints"],
+        "speedups": ["orjson"],
     },
     python_requires=">=3.7",
 )
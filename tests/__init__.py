@@ -1,5 +1,6 @@
 import asyncio
-import contextlib
+import collections
+import os
 import socket
 import ssl
 import tempfile
@@ -7,6 +8,13 @@ from datetime import datetime, timedelta
 
 import aiohttp
 import aiohttp.test_utils
+from cryptography import x509
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+
+_BACKEND = default_backend()
 
 
 class FakeResolver:
@@ -41,8 +49,10 @@ class CaseControlledTestServer(aiohttp.test_utils.RawTestServer):
     def __init__(self, ssl=None, **kwargs):
         super().__init__(self._handle_request, **kwargs)
         self._ssl = ssl
-        self._requests = asyncio.Queue()
-        self._responses = {}
+        self._requests = collections.deque()
+        self._next_request = None
+        # Outstanding responses are only tracked so they can be cancelled on close
+        self._responses = set()
 
     async def start_server(self, **kwargs):
         kwargs.setdefault("ssl", self._ssl)
@@ -50,90 +60,91 @@ class CaseControlledTestServer(aiohttp.test_utils.RawTestServer):
 
     async def close(self):
         """Cancel all pending requests."""
-        for future in self._responses.values():
+        for future in self._responses:
             future.cancel()
         await super().close()
 
     async def _handle_request(self, request):
         """Push the request to the test case and wait until it provides a response."""
-        self._responses[id(request)] = response = asyncio.Future()
-        self._requests.put_nowait(request)
+        # The response future travels with the request, so no lookup table is needed
+        request["response"] = response = asyncio.get_event_loop().create_future()
+        self._responses.add(response)
+        if self._next_request is not None and not self._next_request.done():
+            # Hand the request straight to the waiting test case
+            self._next_request.set_result(request)
+        else:
+            self._requests.append(request)
 
         try:
             # Wait until the test case provides a response
             return await response
         finally:
-            del self._responses[id(request)]
+            self._responses.discard(response)
 
     async def receive_request(self, timeout=None):
         """Wait until the test server receives a request."""
-        return await asyncio.wait_for(self._requests.get(), timeout=timeout)
+        if self._requests:
+            return self._requests.popleft()
+
+        self._next_request = asyncio.get_event_loop().create_future()
+        try:
+            return await asyncio.wait_for(self._next_request, timeout=timeout)
+        finally:
+            self._next_request = None
 
     def send_response(self, request, *args, **kwargs):
         """Send a web resposne from the test case to the client."""
         response = aiohttp.web.Response(*args, **kwargs)
-        self._responses[id(request)].set_result(response)
+        request["response"].set_result(response)
 
 
 class TemporaryCertificate:
     def __enter__(self):
-        from cryptography import x509
-        from cryptography.hazmat.backends import default_backend
-        from cryptography.hazmat.primitives import hashes, serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
-
         subject = issuer = x509.Name(
             [x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, "localhost")]
         )
 
-        with contextlib.ExitStack() as stack:
-            key = rsa.generate_private_key(
-                public_exponent=65537, key_size=1024, backend=default_backend()
+        # Ed25519 keys are much cheaper to generate than RSA keys
+        key = ed25519.Ed25519PrivateKey.generate()
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(issuer)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(datetime.utcnow())
+            .not_valid_after(datetime.utcnow() + timedelta(days=1))
+            .add_extension(
+                x509.SubjectAlternativeName(
+                    [x509.DNSName("localhost"), x509.DNSName("127.0.0.1")]
+                ),
+                critical=False,
             )
-
-            key_file = stack.enter_context(tempfile.NamedTemporaryFile(delete=False))
-            key_file.write(
-                key.private_bytes(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PrivateFormat.TraditionalOpenSSL,
-                    encryption_algorithm=serialization.NoEncryption(),
-                )
-            )
-            key_file.flush()
-
-            cert = (
-                x509.CertificateBuilder()
-                .subject_name(subject)
-                .issuer_name(issuer)
-                .public_key(key.public_key())
-                .serial_number(x509.random_serial_number())
-                .not_valid_before(datetime.utcnow())
-                .not_valid_after(datetime.utcnow() + timedelta(days=1))
-                .add_extension(
-                    x509.SubjectAlternativeName(
-                        [x509.DNSName("localhost"), x509.DNSName("127.0.0.1")]
-                    ),
-                    critical=False,
-                )
-                .sign(key, hashes.SHA256(), default_backend())
+            .sign(key, None, _BACKEND)
+        )
+        self._cert_pem = cert.public_bytes(serialization.Encoding.PEM)
+
+        # Only the server needs a file, which can hold both the key and certificate
+        self._chain_file = tempfile.NamedTemporaryFile(delete=False)
+        self._chain_file.write(
+            key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
             )
-
-            cert_file = stack.enter_context(tempfile.NamedTemporaryFile(delete=False))
-            cert_file.write(cert.public_bytes(serialization.Encoding.PEM))
-            cert_file.flush()
-
-            self._key_file, self._cert_file = key_file, cert_file
-            stack.pop_all()
+        )
+        self._chain_file.write(self._cert_pem)
+        self._chain_file.flush()
 
         return self
 
     def __exit__(self, exc, exc_type, tb):
-        self._key_file.close()
-        self._cert_file.close()
+        self._chain_file.close()
+        os.unlink(self._chain_file.name)
 
     def load_verify(self, context):
         """Load the certificate for verification purposes."""
-        context.load_verify_locations(cafile=self._cert_file.name)
+        context.load_verify_locations(cadata=self._cert_pem.decode())
 
     def client_context(self):
         """A client-side SSL context accepting the certificate, and no others."""
@@ -145,5 +156,5 @@ class TemporaryCertificate:
     def server_context(self):
         """A server-side SSL context using the certificate."""
         context = ssl.SSLContext()
-        context.load_cert_chain(self._cert_file.name, keyfile=self._key_file.name)
+        context.load_cert_chain(self._chain_file.name)
         return context
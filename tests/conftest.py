@@ -1,4 +1,3 @@
-import asyncio
 import json
 from collections import namedtuple
 
@@ -7,7 +6,6 @@ import pytest
 from yarl import URL
 
 from aiorobinhood import RobinhoodClient
-from aiorobinhood.urls import ACCOUNTS, LOGIN
 from tests import CaseControlledTestServer, FakeResolver, TemporaryCertificate
 
 
@@ -16,6 +14,7 @@ _RedirectContext = namedtuple("RedirectContext", "add_server session")
 
 def pytest_configure():
     pytest.TIMEOUT = 1
+    pytest.SHORT_TIMEOUT = 0.1
     pytest.ACCOUNT_NUM = "A1B2C3D4"
     pytest.ACCOUNT_URL = "https://api.robinhood.com/accounts/A1B2C3D4/"
     pytest.ACCESS_TOKEN = "access"
@@ -26,50 +25,28 @@ def pytest_configure():
 @pytest.fixture
 async def logged_in_client(http_redirect, ssl_certificate, tmp_path):
     """A logged-in Robinhood client/server fixture."""
+    # Restore a saved session rather than replaying the login flow for every test
+    session_file = tmp_path / ".aiorobinhood.json"
+    session_file.write_text(
+        json.dumps(
+            {
+                "device_token": "device",
+                "access_token": f"Bearer {pytest.ACCESS_TOKEN}",
+                "refresh_token": pytest.REFRESH_TOKEN,
+                "account_url": pytest.ACCOUNT_URL,
+                "account_num": pytest.ACCOUNT_NUM,
+            }
+        )
+    )
+
     async with CaseControlledTestServer(ssl=ssl_certificate.server_context()) as server:
         http_redirect.add_server("api.robinhood.com", 443, server.port)
         client = RobinhoodClient(
             timeout=pytest.TIMEOUT,
             session=http_redirect.session,
-            session_file=str(tmp_path / ".aiorobinhood.pickle"),
-        )
-
-        task = asyncio.create_task(client.login(username="robin", password="hood"))
-        request = await server.receive_request(timeout=pytest.TIMEOUT)
-        assert request.method == "POST"
-        assert request.path == LOGIN.path
-        server.send_response(
-            request,
-            content_type="application/json",
-            text=json.dumps(
-                {
-                    "access_token": pytest.ACCESS_TOKEN,
-                    "refresh_token": pytest.REFRESH_TOKEN,
-                }
-            ),
-        )
-
-        request = await server.receive_request(timeout=pytest.TIMEOUT)
-        assert request.method == "GET"
-        assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
-        assert request.path == ACCOUNTS.path
-        server.send_response(
-            request,
-            content_type="application/json",
-            text=json.dumps(
-                {
-                    "results": [
-                        {
-                            "url": pytest.ACCOUNT_URL,
-                            "account_number": pytest.ACCOUNT_NUM,
-                        }
-                    ]
-                }
-            ),
+            session_file=str(session_file),
         )
-
-        result = await asyncio.wait_for(task, pytest.TIMEOUT)
-        assert result is None
+        await client.load()
         yield client, server
 
 
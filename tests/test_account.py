@@ -37,6 +37,30 @@ async def test_get_positions(logged_in_client):
     assert result == [{"foo": "bar"}, {"baz": "quux"}]
 
 
+@pytest.mark.asyncio
+async def test_iter_positions(logged_in_client):
+    client, server = logged_in_client
+
+    async def collect():
+        return [position async for position in client.iter_positions(nonzero=False)]
+
+    task = asyncio.create_task(collect())
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.method == "GET"
+    assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+    assert request.path == POSITIONS.path
+    assert request.query["nonzero"] == "false"
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"next": None, "results": [{"foo": "bar"}]}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == [{"foo": "bar"}]
+
+
 @pytest.mark.asyncio
 async def test_get_watchlist(logged_in_client):
     client, server = logged_in_client
@@ -0,0 +1,47 @@
+from aiorobinhood import cache
+from aiorobinhood.cache import TTLCache
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(cache, "monotonic", lambda: now)
+
+    ttl_cache = TTLCache(maxsize=2)
+    ttl_cache.set("foo", 1, ttl=10)
+    assert ttl_cache.get("foo") == 1
+
+    now = 110.0
+    assert ttl_cache.get("foo") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_stale(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(cache, "monotonic", lambda: now)
+
+    ttl_cache = TTLCache(maxsize=2)
+    ttl_cache.set("foo", 1, ttl=10, stale_ttl=10)
+
+    now = 110.0
+    assert ttl_cache.get("foo") is None
+    assert ttl_cache.get_stale("foo") == 1
+
+    now = 120.0
+    assert ttl_cache.get_stale("foo") is None
+    assert len(ttl_cache) == 0
+
+
+def test_ttl_cache_eviction():
+    ttl_cache = TTLCache(maxsize=2)
+    ttl_cache.set("foo", 1, ttl=10)
+    ttl_cache.set("bar", 2, ttl=10)
+    assert ttl_cache.get("foo") == 1
+
+    # "bar" is now the least recently used entry
+    ttl_cache.set("baz", 3, ttl=10)
+    assert ttl_cache.get("bar") is None
+    assert ttl_cache.get("foo") == 1
+    assert ttl_cache.get("baz") == 3
+
+    ttl_cache.clear()
+    assert len(ttl_cache) == 0
@@ -0,0 +1,24 @@
+import pytest
+
+from aiorobinhood.decorators import mutually_exclusive
+
+
+@pytest.mark.asyncio
+async def test_guarded_generator_closed():
+    closed = False
+
+    @mutually_exclusive("foo", "bar")
+    async def gen(foo=None, bar=None):
+        nonlocal closed
+        try:
+            for i in range(3):
+                yield i
+        finally:
+            closed = True
+
+    agen = gen(foo=1)
+    assert await agen.__anext__() == 0
+
+    # Closing the wrapper closes the inner generator right away
+    await agen.aclose()
+    assert closed
@@ -1,4 +1,5 @@
 import asyncio
+import json
 
 import aiohttp
 import pytest
@@ -10,6 +11,7 @@ from aiorobinhood import (
     ClientUninitializedError,
     RobinhoodClient,
 )
+from aiorobinhood.ratelimit import RateLimiter
 from tests import CaseControlledTestServer, TemporaryCertificate
 
 
@@ -21,25 +23,157 @@ async def test_request_api_error(logged_in_client):
     request = await server.receive_request(timeout=pytest.TIMEOUT)
     assert request.method == "GET"
     assert request.path == pytest.NEXT.path
-    server.send_response(request, status=400, content_type="application/json")
+    server.send_response(
+        request, status=400, content_type="application/json", text='{"detail": "x"}'
+    )
 
-    with pytest.raises(ClientAPIError):
+    with pytest.raises(ClientAPIError) as exc_info:
         await task
+    assert exc_info.value.status == 400
+    assert exc_info.value.response == {"detail": "x"}
+    assert str(exc_info.value) == (
+        f"GET request to {pytest.NEXT} responded with a 400 error.\n"
+        "Full Response: {'detail': 'x'}"
+    )
+    assert repr(exc_info.value) == (
+        f"ClientAPIError(method='GET', url='{pytest.NEXT}', status=400)"
+    )
+    assert exc_info.value.args == (str(exc_info.value),)
 
 
 @pytest.mark.asyncio
-async def test_request_timeout_error(logged_in_client):
+async def test_request_coalesced_per_headers(logged_in_client):
     client, server = logged_in_client
+    tasks = [
+        asyncio.create_task(
+            client.request(method="GET", url=pytest.NEXT, headers={"X-Caller": caller})
+        )
+        for caller in ("a", "b")
+    ]
+
+    # Callers sending different headers do not share a response
+    for _ in tasks:
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        server.send_response(
+            request,
+            content_type="application/json",
+            text=json.dumps({"caller": request.headers["X-Caller"]}),
+        )
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks), pytest.TIMEOUT)
+    assert results == [{"caller": "a"}, {"caller": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_request_rate_limited_retry(logged_in_client, monkeypatch):
+    client, server = logged_in_client
+    monkeypatch.setattr(RobinhoodClient, "_RETRY_BACKOFF", 0)
+    client._limiter = RateLimiter(10)
     task = asyncio.create_task(client.request(method="GET", url=pytest.NEXT))
 
+    # Retry-After is honored, and exponential backoff is used without it
+    for headers in ({"Retry-After": "0"}, {"Retry-After": "soon"}, {}):
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.path == pytest.NEXT.path
+        server.send_response(
+            request, status=429, headers=headers, content_type="application/json"
+        )
+
     request = await server.receive_request(timeout=pytest.TIMEOUT)
-    assert request.method == "GET"
-    assert request.path == pytest.NEXT.path
+    server.send_response(request, content_type="application/json", text="{}")
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == {}
+
+
+@pytest.mark.asyncio
+async def test_request_rate_limited_error(logged_in_client, monkeypatch):
+    client, server = logged_in_client
+    monkeypatch.setattr(RobinhoodClient, "_MAX_RETRIES", 0)
+    task = asyncio.create_task(client.request(method="GET", url=pytest.NEXT))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(request, status=429, content_type="application/json")
+
+    with pytest.raises(ClientAPIError) as exc_info:
+        await task
+    assert exc_info.value.status == 429
+
+
+@pytest.mark.asyncio
+async def test_request_rate_limited_retry_after_too_long(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.request(method="GET", url=pytest.NEXT))
+
+    # Waiting longer than the request timeout is not worth it, so the error is raised
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        status=429,
+        headers={"Retry-After": "3600"},
+        content_type="application/json",
+    )
+
+    with pytest.raises(ClientAPIError) as exc_info:
+        await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert exc_info.value.status == 429
+
+
+@pytest.mark.asyncio
+async def test_request_api_error_not_json(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.request(method="GET", url=pytest.NEXT))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(request, status=502, content_type="text/html", text="<p>")
+
+    with pytest.raises(ClientAPIError) as exc_info:
+        await task
+    assert exc_info.value.status == 502
+    assert exc_info.value.response == {"raw": "<p>"}
+
+
+@pytest.mark.asyncio
+async def test_request_decode_error(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.request(method="GET", url=pytest.NEXT))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(request, content_type="text/html", text="<html></html>")
 
     with pytest.raises(ClientRequestError) as exc_info:
-        await asyncio.sleep(pytest.TIMEOUT + 1)
         await task
-    assert isinstance(exc_info.value.__cause__, asyncio.TimeoutError)
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert str(exc_info.value) == (
+        f"An error occurred reaching Robinhood.\nRequest: GET {pytest.NEXT}\n"
+    )
+    assert repr(exc_info.value) == (
+        f"ClientRequestError(method='GET', url='{pytest.NEXT}')"
+    )
+    assert exc_info.value.args == (str(exc_info.value),)
+
+
+def test_request_error_message():
+    exc = ClientRequestError("GET", pytest.NEXT, "Custom message")
+    assert str(exc) == "Custom message"
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_error(http_redirect, ssl_certificate):
+    async with CaseControlledTestServer(ssl=ssl_certificate.server_context()) as server:
+        http_redirect.add_server("api.robinhood.com", 443, server.port)
+        client = RobinhoodClient(
+            timeout=pytest.SHORT_TIMEOUT, session=http_redirect.session
+        )
+        task = asyncio.create_task(client.request(method="GET", url=pytest.NEXT))
+
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.method == "GET"
+        assert request.path == pytest.NEXT.path
+
+        with pytest.raises(ClientRequestError) as exc_info:
+            await task
+        assert isinstance(exc_info.value.__cause__, asyncio.TimeoutError)
 
 
 @pytest.mark.asyncio
@@ -68,6 +202,14 @@ async def test_request_invalid_certificate(http_redirect):
             )
 
 
+@pytest.mark.asyncio
+async def test_request_json_not_serializable(logged_in_client):
+    client, _ = logged_in_client
+    with pytest.raises(ClientRequestError) as exc_info:
+        await client.request(method="POST", url=pytest.NEXT, json={"foo": object()})
+    assert isinstance(exc_info.value.__cause__, TypeError)
+
+
 @pytest.mark.asyncio
 async def test_request_uninitialized_client():
     client = RobinhoodClient(timeout=pytest.TIMEOUT)
@@ -80,3 +222,5 @@ async def test_request_bad_origin(logged_in_client):
     client, _ = logged_in_client
     with pytest.raises(ValueError):
         await client.request(method="GET", url=URL("https://foobar.com"))
+    with pytest.raises(ValueError):
+        await client.request(method="GET", url="https://api.robinhood.com.foobar.com/")
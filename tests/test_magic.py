@@ -9,6 +9,15 @@ async def test_async_context_manager():
     async with RobinhoodClient(timeout=pytest.TIMEOUT) as client:
         assert client._session is not None
         assert isinstance(client._session, aiohttp.ClientSession)
+        assert client._session.connector.limit == 32
+        assert client._session.connector.limit_per_host == 32
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_pool_size():
+    async with RobinhoodClient(timeout=pytest.TIMEOUT, pool_size=8) as client:
+        assert client._session.connector.limit == 8
+        assert client._session.connector.limit_per_host == 8
 
 
 @pytest.mark.asyncio
@@ -16,3 +25,15 @@ async def test_async_context_manager_client_uninitialized_error():
     with pytest.raises(ClientUninitializedError):
         async with RobinhoodClient(timeout=pytest.TIMEOUT) as client:
             client._session = None
+
+
+@pytest.mark.asyncio
+async def test_close():
+    session = aiohttp.ClientSession()
+    client = RobinhoodClient(timeout=pytest.TIMEOUT, session=session)
+    await client.close()
+    assert session.closed
+    assert client._session is None
+
+    # Closing an already closed client is a no-op
+    await client.close()
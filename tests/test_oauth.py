@@ -7,7 +7,7 @@ from io import StringIO
 
 import pytest
 
-from aiorobinhood import ClientAPIError, ClientUnauthenticatedError
+from aiorobinhood import ClientAPIError, ClientUnauthenticatedError, RobinhoodClient
 from aiorobinhood.urls import ACCOUNTS, CHALLENGE, LOGIN, LOGOUT
 
 
@@ -19,6 +19,66 @@ def replace_input(target):
     sys.stdin = orig
 
 
+def test_device_token_reused(tmp_path):
+    session_file = str(tmp_path / ".aiorobinhood.json")
+    client = RobinhoodClient(timeout=pytest.TIMEOUT, session_file=session_file)
+    other = RobinhoodClient(timeout=pytest.TIMEOUT, session_file=session_file)
+    assert client._device_token == other._device_token
+
+    with open(session_file, "r") as f:
+        assert json.load(f) == {"device_token": client._device_token}
+
+
+def test_legacy_session_file_migrated(tmp_path):
+    session_file = str(tmp_path / ".aiorobinhood.pickle")
+    with open(session_file, "wb") as f:
+        pickle.dump({"device_token": "abc"}, f)
+
+    client = RobinhoodClient(timeout=pytest.TIMEOUT, session_file=session_file)
+    assert client._device_token == "abc"
+
+    with open(session_file, "r") as f:
+        assert json.load(f) == {"device_token": "abc"}
+
+
+def test_legacy_session_file_migrated_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open(".aiorobinhood.pickle", "wb") as f:
+        pickle.dump({"device_token": "abc"}, f)
+
+    client = RobinhoodClient(timeout=pytest.TIMEOUT)
+    assert client._device_token == "abc"
+
+    with open(".aiorobinhood.json", "r") as f:
+        assert json.load(f) == {"device_token": "abc"}
+
+    # The migrated JSON file takes precedence from then on
+    other = RobinhoodClient(timeout=pytest.TIMEOUT)
+    assert other._device_token == "abc"
+
+
+def test_custom_session_file_migrated(tmp_path):
+    session_file = str(tmp_path / "session")
+    with open(session_file, "wb") as f:
+        pickle.dump({"device_token": "abc"}, f)
+
+    client = RobinhoodClient(timeout=pytest.TIMEOUT, session_file=session_file)
+    assert client._device_token == "abc"
+
+    with open(session_file, "r") as f:
+        assert json.load(f) == {"device_token": "abc"}
+
+
+def test_session_file_not_json(tmp_path):
+    session_file = str(tmp_path / ".aiorobinhood.json")
+    with open(session_file, "w") as f:
+        f.write("device_token: abc")
+
+    # Only JSON or legacy pickle data is accepted
+    with pytest.raises(ValueError, match="not a JSON session file"):
+        RobinhoodClient(timeout=pytest.TIMEOUT, session_file=session_file)
+
+
 @pytest.mark.asyncio
 async def test_login_sfa_flow(logged_out_client):
     client, server = logged_out_client
@@ -53,6 +113,7 @@ async def test_login_sfa_flow(logged_out_client):
         request = await server.receive_request(timeout=pytest.TIMEOUT)
         assert request.method == "POST"
         assert request.path == LOGIN.path
+        assert request.headers["x-robinhood-challenge-response-id"] == challenge_id
         server.send_response(
             request,
             content_type="application/json",
@@ -87,6 +148,49 @@ async def test_login_sfa_flow(logged_out_client):
         assert result is None
 
 
+@pytest.mark.asyncio
+async def test_login_challenge_provider(logged_out_client):
+    client, server = logged_out_client
+    prompts = []
+
+    async def challenge_provider(prompt):
+        prompts.append(prompt)
+        return "123456"
+
+    client._challenge_provider = challenge_provider
+    task = asyncio.create_task(client.login(username="robin", password="hood"))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"mfa_required": True, "mfa_type": "app"}),
+    )
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert (await request.json())["mfa_code"] == "123456"
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps(
+            {"access_token": pytest.ACCESS_TOKEN, "refresh_token": pytest.REFRESH_TOKEN}
+        ),
+    )
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.path == ACCOUNTS.path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps(
+            {"results": [{"url": pytest.ACCOUNT_URL, "account_number": "12345"}]}
+        ),
+    )
+
+    await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert prompts == ["Enter the app code: "]
+
+
 @pytest.mark.asyncio
 async def test_login_mfa_flow(logged_out_client):
     client, server = logged_out_client
@@ -257,16 +361,43 @@ async def test_dump(logged_in_client):
     client, _ = logged_in_client
     await client.dump()
 
-    with open(client._session_file, "rb") as f:
-        data = pickle.load(f)
+    with open(client._session_file, "r") as f:
+        data = json.load(f)
         assert data["access_token"] == f"Bearer {pytest.ACCESS_TOKEN}"
         assert data["refresh_token"] == pytest.REFRESH_TOKEN
+        assert data["account_url"] == pytest.ACCOUNT_URL
+        assert data["account_num"] == pytest.ACCOUNT_NUM
 
 
 @pytest.mark.asyncio
 async def test_load(logged_in_client):
-    client, server = logged_in_client
+    client, _ = logged_in_client
     await client.dump()
+    client._set_access_token(None)
+    client._refresh_token = None
+    client._account_url = None
+    client._account_num = None
+
+    result = await client.load()
+    assert client._access_token == f"Bearer {pytest.ACCESS_TOKEN}"
+    assert client._refresh_token == pytest.REFRESH_TOKEN
+    assert client._account_url == pytest.ACCOUNT_URL
+    assert client._account_num == pytest.ACCOUNT_NUM
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_load_without_account(logged_in_client):
+    client, server = logged_in_client
+    with open(client._session_file, "w") as f:
+        json.dump(
+            {
+                "device_token": client._device_token,
+                "access_token": f"Bearer {pytest.ACCESS_TOKEN}",
+                "refresh_token": pytest.REFRESH_TOKEN,
+            },
+            f,
+        )
     task = asyncio.create_task(client.load())
 
     request = await server.receive_request(timeout=pytest.TIMEOUT)
@@ -288,4 +419,27 @@ async def test_load(logged_in_client):
     result = await asyncio.wait_for(task, pytest.TIMEOUT)
     assert client._access_token == f"Bearer {pytest.ACCESS_TOKEN}"
     assert client._refresh_token == pytest.REFRESH_TOKEN
+    assert client._account_url == pytest.ACCOUNT_URL
+    assert client._account_num == pytest.ACCOUNT_NUM
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_account_cache(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.refresh_account_cache())
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.method == "GET"
+    assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+    assert request.path == ACCOUNTS.path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"url": "<>", "account_number": "12345"}]}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert client._account_url == "<>"
+    assert client._account_num == "12345"
     assert result is None
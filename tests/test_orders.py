@@ -3,9 +3,18 @@ import json
 
 import pytest
 
+from aiorobinhood import ClientAPIError, ClientUnauthenticatedError
+from aiorobinhood.client import json_dumps
 from aiorobinhood.urls import INSTRUMENTS, ORDERS, QUOTES
 
 
+class Float64(float):
+    """A float subclass whose repr is not a plain number, like ``numpy.float64``."""
+
+    def __repr__(self):
+        return f"np.float64({float(self)!r})"
+
+
 @pytest.mark.asyncio
 async def test_get_orders(logged_in_client):
     client, server = logged_in_client
@@ -35,6 +44,90 @@ async def test_get_orders(logged_in_client):
     assert result == [{"foo": "bar"}, {"baz": "quux"}]
 
 
+@pytest.mark.asyncio
+async def test_get_orders_no_pages(logged_in_client):
+    client, _ = logged_in_client
+    result = await asyncio.wait_for(client.get_orders(pages=0), pytest.TIMEOUT)
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_iter_orders(logged_in_client):
+    client, server = logged_in_client
+    orders = client.iter_orders()
+    task = asyncio.create_task(orders.__anext__())
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.method == "GET"
+    assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+    assert request.path == ORDERS.path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"next": str(pytest.NEXT), "results": [{"foo": "bar"}]}),
+    )
+
+    # The first order is available before the next page is requested
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == {"foo": "bar"}
+    await orders.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_orders_unauthenticated_client(logged_out_client):
+    client, _ = logged_out_client
+    with pytest.raises(ClientUnauthenticatedError):
+        await client.iter_orders().__anext__()
+
+
+@pytest.mark.asyncio
+async def test_get_orders_coalesced(logged_in_client):
+    client, server = logged_in_client
+    tasks = [asyncio.create_task(client.get_orders()) for _ in range(2)]
+
+    # Both callers share each page, so the server only sees one request per page
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.path == ORDERS.path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"next": str(pytest.NEXT), "results": [{"foo": "bar"}]}),
+    )
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.path == pytest.NEXT.path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"next": None, "results": [{"baz": "quux"}]}),
+    )
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks), pytest.TIMEOUT)
+    assert results == [[{"foo": "bar"}, {"baz": "quux"}]] * 2
+    # Each caller gets its own copy of the shared responses
+    assert results[0][0] is not results[1][0]
+
+
+@pytest.mark.asyncio
+async def test_get_orders_by_id(logged_in_client):
+    client, server = logged_in_client
+    order_id = "12345"
+    task = asyncio.create_task(client.get_orders(order_id=order_id))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.method == "GET"
+    assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+    assert request.path == (ORDERS / f"{order_id}/").path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"id": order_id}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == [{"id": order_id}]
+
+
 @pytest.mark.asyncio
 async def test_cancel_order(logged_in_client):
     client, server = logged_in_client
@@ -52,10 +145,127 @@ async def test_cancel_order(logged_in_client):
 
 
 @pytest.mark.asyncio
-async def test_place_limit_buy_order(logged_in_client):
+async def test_place_orders_bulk(logged_in_client):
+    client, server = logged_in_client
+    orders = [
+        {"symbol": symbol, "side": "buy", "type": "market", "quantity": 1}
+        for symbol in ("A", "B")
+    ]
+    task = asyncio.create_task(client.place_orders_bulk(orders))
+
+    # Every instrument is looked up in one request before any order is placed
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.method == "GET"
+    assert request.path == QUOTES.path
+    assert request.query["symbols"] == "A,B"
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps(
+            {
+                "results": [
+                    {"symbol": "A", "instrument": "<A>"},
+                    {"symbol": "B", "instrument": "<B>"},
+                ]
+            }
+        ),
+    )
+
+    for _ in range(2):
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.method == "POST"
+        assert request.path == ORDERS.path
+        request_json = await request.json()
+        symbol = request_json["symbol"]
+        assert request_json["instrument"] == f"<{symbol}>"
+        server.send_response(
+            request,
+            status=201,
+            content_type="application/json",
+            text=json.dumps({"id": f"ID-{symbol}"}),
+        )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == ["ID-A", "ID-B"]
+
+
+@pytest.mark.asyncio
+async def test_place_orders_bulk_partial_failure(logged_in_client):
+    client, server = logged_in_client
+    orders = [
+        {"symbol": symbol, "side": "buy", "type": "market", "quantity": 1}
+        for symbol in ("A", "B")
+    ]
+    task = asyncio.create_task(client.place_orders_bulk(orders))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps(
+            {
+                "results": [
+                    {"symbol": "A", "instrument": "<A>"},
+                    {"symbol": "B", "instrument": "<B>"},
+                ]
+            }
+        ),
+    )
+
+    for _ in range(2):
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        if (await request.json())["symbol"] == "A":
+            server.send_response(
+                request,
+                status=201,
+                content_type="application/json",
+                text=json.dumps({"id": "ID-A"}),
+            )
+        else:
+            server.send_response(request, status=400, content_type="application/json")
+
+    # The ID of the placed order is kept even though its sibling was rejected
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result[0] == "ID-A"
+    assert isinstance(result[1], ClientAPIError)
+    assert result[1].status == 400
+
+
+@pytest.mark.asyncio
+async def test_place_orders_bulk_unknown_symbol(logged_in_client):
+    client, server = logged_in_client
+    orders = [
+        {"symbol": symbol, "side": "buy", "type": "market", "quantity": 1}
+        for symbol in ("A", "B")
+    ]
+    task = asyncio.create_task(client.place_orders_bulk(orders))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"symbol": "A", "instrument": "<A>"}, None]}),
+    )
+
+    # No order is placed unless every symbol is recognized
+    with pytest.raises(ValueError, match="B"):
+        await asyncio.wait_for(task, pytest.TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_place_orders_bulk_instrument(logged_in_client):
+    client, _ = logged_in_client
+    orders = [{"symbol": "A", "instrument": "<A>", "side": "buy", "type": "market"}]
+    with pytest.raises(ValueError, match="instrument"):
+        await client.place_orders_bulk(orders)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("price", [12.50, Float64(12.50)])
+async def test_place_limit_buy_order(logged_in_client, price):
     client, server = logged_in_client
     task = asyncio.create_task(
-        client.place_limit_buy_order(symbol="ABCD", price=12.50, quantity=1)
+        client.place_limit_buy_order(symbol="ABCD", price=price, quantity=1)
     )
 
     request = await server.receive_request(timeout=pytest.TIMEOUT)
@@ -93,6 +303,82 @@ async def test_place_limit_buy_order(logged_in_client):
     assert result == "ID"
 
 
+def test_json_dumps_float_subclass():
+    pytest.importorskip("orjson")
+    assert json.loads(json_dumps({"price": Float64(12.50)})) == {"price": 12.5}
+
+
+@pytest.mark.asyncio
+async def test_place_order_instrument_cached(logged_in_client):
+    client, server = logged_in_client
+
+    async def place_order(lookup):
+        task = asyncio.create_task(
+            client.place_limit_buy_order(symbol="ABCD", price=12.50, quantity=1)
+        )
+        if lookup:
+            request = await server.receive_request(timeout=pytest.TIMEOUT)
+            assert request.path == INSTRUMENTS.path
+            server.send_response(
+                request,
+                content_type="application/json",
+                text=json.dumps({"next": None, "results": [{"url": "<>"}]}),
+            )
+
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.path == ORDERS.path
+        assert (await request.json())["instrument"] == "<>"
+        server.send_response(
+            request,
+            status=201,
+            content_type="application/json",
+            text=json.dumps({"id": "ID"}),
+        )
+        assert await asyncio.wait_for(task, pytest.TIMEOUT) == "ID"
+
+    await place_order(lookup=True)
+    await place_order(lookup=False)
+    client.invalidate_instrument("ABCD")
+    await place_order(lookup=True)
+
+
+@pytest.mark.asyncio
+async def test_place_order_instrument_from_quote(logged_in_client):
+    client, server = logged_in_client
+
+    async def place_order(order, path):
+        task = asyncio.create_task(order)
+        if path is not None:
+            request = await server.receive_request(timeout=pytest.TIMEOUT)
+            assert request.path == path
+            server.send_response(
+                request,
+                content_type="application/json",
+                text=json.dumps(
+                    {"results": [{"instrument": "<>", "ask_price": "1.0"}]}
+                ),
+            )
+
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.path == ORDERS.path
+        assert (await request.json())["instrument"] == "<>"
+        server.send_response(
+            request,
+            status=201,
+            content_type="application/json",
+            text=json.dumps({"id": "ID"}),
+        )
+        assert await asyncio.wait_for(task, pytest.TIMEOUT) == "ID"
+
+    # The quote of a market order also yields the instrument of later limit orders
+    await place_order(
+        client.place_market_buy_order(symbol="ABCD", quantity=1), QUOTES.path
+    )
+    await place_order(
+        client.place_limit_buy_order(symbol="ABCD", price=12.50, quantity=1), None
+    )
+
+
 @pytest.mark.asyncio
 async def test_place_limit_sell_order(logged_in_client):
     client, server = logged_in_client
@@ -224,6 +510,37 @@ async def test_place_market_buy_order_by_quantity(logged_in_client):
     assert result == "ID"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("amount", [1.005, Float64(1.005)])
+async def test_place_market_buy_order_rounds_half_up(logged_in_client, amount):
+    client, server = logged_in_client
+    task = asyncio.create_task(
+        client.place_market_buy_order(symbol="ABCD", amount=amount)
+    )
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"instrument": "<>", "ask_price": "0.5"}]}),
+    )
+
+    # round() would turn 1.005 into 1.0, as it is stored just below 1.005
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    request_json = await request.json()
+    assert request_json["quantity"] == 2.01
+    assert request_json["dollar_based_amount"]["amount"] == 1.01
+    server.send_response(
+        request,
+        status=201,
+        content_type="application/json",
+        text=json.dumps({"id": "ID"}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == "ID"
+
+
 @pytest.mark.asyncio
 async def test_place_market_buy_order_value_error(logged_in_client):
     client, _ = logged_in_client
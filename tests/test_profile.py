@@ -4,7 +4,7 @@ import json
 import pytest
 
 from aiorobinhood import HistoricalInterval, HistoricalSpan
-from aiorobinhood.urls import ACCOUNTS, PORTFOLIOS
+from aiorobinhood.urls import ACCOUNTS, PORTFOLIOS, POSITIONS
 
 
 @pytest.mark.asyncio
@@ -45,6 +45,43 @@ async def test_get_portfolio(logged_in_client):
     assert result == {}
 
 
+@pytest.mark.asyncio
+async def test_get_profile_bundle(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.get_profile_bundle())
+
+    requests = {}
+    for _ in range(3):
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.method == "GET"
+        assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+        requests[request.path] = request
+
+    assert requests.keys() == {ACCOUNTS.path, PORTFOLIOS.path, POSITIONS.path}
+    server.send_response(
+        requests[POSITIONS.path],
+        content_type="application/json",
+        text=json.dumps({"next": None, "results": [{"quantity": "1"}]}),
+    )
+    server.send_response(
+        requests[PORTFOLIOS.path],
+        content_type="application/json",
+        text=json.dumps({"results": [{"equity": "1"}]}),
+    )
+    server.send_response(
+        requests[ACCOUNTS.path],
+        content_type="application/json",
+        text=json.dumps({"results": [{"cash": "1"}]}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == {
+        "account": {"cash": "1"},
+        "portfolio": {"equity": "1"},
+        "positions": [{"quantity": "1"}],
+    }
+
+
 @pytest.mark.asyncio
 async def test_get_historical_portfolio(logged_in_client):
     client, server = logged_in_client
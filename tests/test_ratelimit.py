@@ -0,0 +1,31 @@
+import pytest
+
+from aiorobinhood import ratelimit
+from aiorobinhood.ratelimit import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter(monkeypatch):
+    now = 100.0
+    delays = []
+
+    async def sleep(delay):
+        nonlocal now
+        delays.append(delay)
+        now += delay
+
+    monkeypatch.setattr(ratelimit, "monotonic", lambda: now)
+    monkeypatch.setattr(ratelimit, "sleep", sleep)
+
+    limiter = RateLimiter(2, period=1.0)
+    for _ in range(3):
+        await limiter.acquire()
+
+    # The burst is served immediately, then requests are paced by the rate
+    assert delays == [0.5]
+
+
+@pytest.mark.parametrize("rate, period", [(0, 1.0), (-1, 1.0), (1, 0)])
+def test_rate_limiter_value_error(rate, period):
+    with pytest.raises(ValueError):
+        RateLimiter(rate, period)
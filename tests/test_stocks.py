@@ -3,7 +3,7 @@ import json
 
 import pytest
 
-from aiorobinhood import HistoricalInterval, HistoricalSpan
+from aiorobinhood import HistoricalInterval, HistoricalSpan, RobinhoodClient, cache
 from aiorobinhood.urls import (
     FUNDAMENTALS,
     HISTORICALS,
@@ -63,6 +63,36 @@ async def test_get_fundamentals_value_error(logged_in_client):
         await client.get_fundamentals(symbols=["ABCD"], instruments=["<>"])
 
 
+@pytest.mark.asyncio
+async def test_get_fundamentals_not_modified(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.get_fundamentals(symbols=["ABCD"]))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert "If-None-Match" not in request.headers
+    server.send_response(
+        request,
+        headers={"ETag": '"v1"'},
+        content_type="application/json",
+        text=json.dumps({"results": [{"foo": "bar"}]}),
+    )
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == [{"foo": "bar"}]
+    result[0]["foo"] = "mutated"
+
+    # The unchanged response is reused when the server answers 304, unaffected by
+    # changes callers made to earlier results
+    task = asyncio.create_task(client.get_fundamentals(symbols=["ABCD"]))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.headers["If-None-Match"] == '"v1"'
+    assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+    server.send_response(request, status=304)
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == [{"foo": "bar"}]
+
+
 @pytest.mark.asyncio
 async def test_get_instruments_by_symbol(logged_in_client):
     client, server = logged_in_client
@@ -123,6 +153,41 @@ async def test_get_instruments_by_ids(logged_in_client):
     assert result == [{"foo": "bar"}, {"baz": "quux"}]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs,query", [({"symbol": "ABCD"}, "ABCD"), ({"ids": ["1", "2"]}, "1,2")]
+)
+async def test_iter_instruments(logged_in_client, kwargs, query):
+    client, server = logged_in_client
+    instruments = client.iter_instruments(**kwargs)
+    task = asyncio.create_task(instruments.__anext__())
+
+    (key,) = kwargs
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.method == "GET"
+    assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+    assert request.path == INSTRUMENTS.path
+    assert request.query[key] == query
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"next": str(pytest.NEXT), "results": [{"foo": "bar"}]}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == {"foo": "bar"}
+    await instruments.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_instruments_value_error(logged_in_client):
+    client, _ = logged_in_client
+    with pytest.raises(ValueError):
+        await client.iter_instruments().__anext__()
+    with pytest.raises(ValueError):
+        await client.iter_instruments(symbol="ABCD", ids=["12345"]).__anext__()
+
+
 @pytest.mark.asyncio
 async def test_get_instruments_value_error(logged_in_client):
     client, _ = logged_in_client
@@ -172,6 +237,90 @@ async def test_get_quotes_by_instruments(logged_in_client):
     assert result == [{}]
 
 
+@pytest.mark.asyncio
+async def test_get_quotes_in_batches(logged_in_client, monkeypatch):
+    client, server = logged_in_client
+    monkeypatch.setattr(RobinhoodClient, "_BATCH_SIZE", 2)
+    task = asyncio.create_task(client.get_quotes(symbols=["A", "B", "C"]))
+
+    requests = {}
+    for _ in range(2):
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.method == "GET"
+        assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+        assert request.path == QUOTES.path
+        requests[request.query["symbols"]] = request
+
+    assert requests.keys() == {"A,B", "C"}
+    server.send_response(
+        requests["C"],
+        content_type="application/json",
+        text=json.dumps({"results": [{"symbol": "C"}]}),
+    )
+    server.send_response(
+        requests["A,B"],
+        content_type="application/json",
+        text=json.dumps({"results": [{"symbol": "A"}, {"symbol": "B"}]}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == [{"symbol": "A"}, {"symbol": "B"}, {"symbol": "C"}]
+
+
+@pytest.mark.asyncio
+async def test_get_instrument_urls(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.get_instrument_urls(["A", "B", "XYZ"]))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.method == "GET"
+    assert request.headers["Authorization"] == f"Bearer {pytest.ACCESS_TOKEN}"
+    assert request.path == QUOTES.path
+    assert request.query["symbols"] == "A,B,XYZ"
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps(
+            {
+                "results": [
+                    {"symbol": "A", "instrument": "<A>"},
+                    {"symbol": "B", "instrument": "<B>"},
+                    None,
+                ]
+            }
+        ),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == {"A": "<A>", "B": "<B>"}
+
+    # Known symbols are served from the cache without another request
+    result = await asyncio.wait_for(client.get_instrument_urls(["B"]), pytest.TIMEOUT)
+    assert result == {"B": "<B>"}
+
+
+@pytest.mark.asyncio
+async def test_get_instrument_urls_lower_case(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.get_instrument_urls(["abcd"]))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.query["symbols"] == "ABCD"
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"symbol": "ABCD", "instrument": "<>"}]}),
+    )
+
+    # Results are keyed as the caller spelled them, and cached in either case
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == {"abcd": "<>"}
+    result = await asyncio.wait_for(
+        client.get_instrument_urls(["abcd", "ABCD"]), pytest.TIMEOUT
+    )
+    assert result == {"abcd": "<>", "ABCD": "<>"}
+
+
 @pytest.mark.asyncio
 async def test_get_quotes_value_error(logged_in_client):
     client, _ = logged_in_client
@@ -239,6 +388,120 @@ async def test_get_historical_quotes_by_instruments(logged_in_client):
     assert result == [{}]
 
 
+@pytest.mark.asyncio
+async def test_get_historical_quotes_stale_while_revalidate(
+    logged_in_client, monkeypatch
+):
+    client, server = logged_in_client
+    now = 100.0
+    monkeypatch.setattr(cache, "monotonic", lambda: now)
+
+    async def get_historical_quotes():
+        return await asyncio.wait_for(
+            client.get_historical_quotes(
+                interval=HistoricalInterval.FIVE_MIN,
+                span=HistoricalSpan.DAY,
+                symbols=["ABCD"],
+            ),
+            pytest.TIMEOUT,
+        )
+
+    task = asyncio.create_task(get_historical_quotes())
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"foo": "bar"}]}),
+    )
+    assert await task == [{"foo": "bar"}]
+
+    # The expired response is served immediately and refreshed in the background
+    now += RobinhoodClient._CACHE_TTL["historicals"]
+    assert await get_historical_quotes() == [{"foo": "bar"}]
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.path == HISTORICALS.path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"baz": "quux"}]}),
+    )
+    await asyncio.wait_for(asyncio.gather(*client._refreshing.values()), pytest.TIMEOUT)
+    assert await get_historical_quotes() == [{"baz": "quux"}]
+
+
+@pytest.mark.asyncio
+async def test_get_historical_quotes_cached_copy(logged_in_client):
+    client, server = logged_in_client
+
+    async def get_historical_quotes():
+        return await asyncio.wait_for(
+            client.get_historical_quotes(
+                interval=HistoricalInterval.FIVE_MIN,
+                span=HistoricalSpan.DAY,
+                symbols=["ABCD"],
+            ),
+            pytest.TIMEOUT,
+        )
+
+    task = asyncio.create_task(get_historical_quotes())
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"foo": "bar"}]}),
+    )
+    result = await task
+    assert result == [{"foo": "bar"}]
+
+    # Mutating a result does not leak into the cached response
+    result[0]["foo"] = "mutated"
+    result.append({})
+    assert await get_historical_quotes() == [{"foo": "bar"}]
+
+
+@pytest.mark.asyncio
+async def test_get_historical_quotes_revalidate_error(logged_in_client, monkeypatch):
+    client, server = logged_in_client
+    now = 100.0
+    monkeypatch.setattr(cache, "monotonic", lambda: now)
+
+    async def get_historical_quotes():
+        return await asyncio.wait_for(
+            client.get_historical_quotes(
+                interval=HistoricalInterval.FIVE_MIN,
+                span=HistoricalSpan.DAY,
+                symbols=["ABCD"],
+            ),
+            pytest.TIMEOUT,
+        )
+
+    task = asyncio.create_task(get_historical_quotes())
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"results": [{"foo": "bar"}]}),
+    )
+    assert await task == [{"foo": "bar"}]
+
+    # A failed refresh keeps serving the stale response
+    now += RobinhoodClient._CACHE_TTL["historicals"]
+    assert await get_historical_quotes() == [{"foo": "bar"}]
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(request, status=500, content_type="application/json")
+    await asyncio.wait_for(asyncio.gather(*client._refreshing.values()), pytest.TIMEOUT)
+    assert await get_historical_quotes() == [{"foo": "bar"}]
+
+    # Closing the client cancels pending refreshes
+    await server.receive_request(timeout=pytest.TIMEOUT)
+    refreshing = list(client._refreshing.values())
+    await client.close()
+    await asyncio.gather(*refreshing, return_exceptions=True)
+    assert all(task.cancelled() for task in refreshing)
+
+
 @pytest.mark.asyncio
 async def test_get_historical_quotes_value_error(logged_in_client):
     client, _ = logged_in_client
@@ -278,6 +541,59 @@ async def test_get_ratings(logged_in_client):
     assert result == [{"foo": "bar"}, {"baz": "quux"}]
 
 
+@pytest.mark.asyncio
+async def test_get_ratings_in_batches(logged_in_client, monkeypatch):
+    client, server = logged_in_client
+    monkeypatch.setattr(RobinhoodClient, "_BATCH_SIZE", 2)
+    task = asyncio.create_task(client.get_ratings(ids=["1", "2", "3"]))
+
+    requests = {}
+    for _ in range(2):
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.method == "GET"
+        assert request.path == RATINGS.path
+        requests[request.query["ids"]] = request
+
+    assert requests.keys() == {"1,2", "3"}
+    for ids, request in requests.items():
+        server.send_response(
+            request,
+            content_type="application/json",
+            text=json.dumps(
+                {"next": None, "results": [{"id": id_} for id_ in ids.split(",")]}
+            ),
+        )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+
+
+@pytest.mark.asyncio
+async def test_iter_ratings(logged_in_client, monkeypatch):
+    client, server = logged_in_client
+    monkeypatch.setattr(RobinhoodClient, "_BATCH_SIZE", 1)
+
+    async def collect():
+        return [rating async for rating in client.iter_ratings(ids=["1", "2"])]
+
+    task = asyncio.create_task(collect())
+
+    # Batches are fetched one after the other
+    for id_ in ("1", "2"):
+        request = await server.receive_request(timeout=pytest.TIMEOUT)
+        assert request.method == "GET"
+        assert request.path == RATINGS.path
+        assert request.query["ids"] == id_
+        server.send_response(
+            request,
+            content_type="application/json",
+            text=json.dumps({"next": None, "results": [{"id": id_}]}),
+        )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == [{"id": "1"}, {"id": "2"}]
+
+
 @pytest.mark.asyncio
 async def test_get_tags(logged_in_client):
     client, server = logged_in_client
@@ -297,6 +613,38 @@ async def test_get_tags(logged_in_client):
     assert result == ["foo"]
 
 
+@pytest.mark.asyncio
+async def test_get_tags_cached(logged_in_client):
+    client, server = logged_in_client
+    task = asyncio.create_task(client.get_tags(id_="12345"))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"tags": [{"slug": "foo"}]}),
+    )
+    assert await asyncio.wait_for(task, pytest.TIMEOUT) == ["foo"]
+
+    # The second call is served from the cache without hitting the server
+    result = await asyncio.wait_for(client.get_tags(id_="12345"), pytest.TIMEOUT)
+    assert result == ["foo"]
+
+    client.clear_cache()
+    task = asyncio.create_task(client.get_tags(id_="12345"))
+
+    request = await server.receive_request(timeout=pytest.TIMEOUT)
+    assert request.path == (TAGS / "instrument" / "12345/").path
+    server.send_response(
+        request,
+        content_type="application/json",
+        text=json.dumps({"tags": [{"slug": "bar"}]}),
+    )
+
+    result = await asyncio.wait_for(task, pytest.TIMEOUT)
+    assert result == ["bar"]
+
+
 @pytest.mark.asyncio
 async def test_get_tag_members(logged_in_client):
     client, server = logged_in_client